@@ -0,0 +1,254 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import platform
+import threading
+import subprocess
+import datetime
+import uuid
+import http.server
+from xml.sax.saxutils import escape
+
+from easy_engine import DEFAULTS, EasyEngine, EasyProfiler, lazy, percentile, fmt_bytes
+
+KINDS = ("mp4", "hls")
+# metric -> +1 if higher is better, -1 if lower is better
+METRICS = {"items_per_s": 1, "bytes_per_s": 1, "scan_s": -1, "wall_s": -1, "latency.p50": -1, "latency.p90": -1,
+           "latency.p99": -1, "phases.setup.p50": -1, "phases.transfer.p50": -1, "phases.post.p50": -1, "rss_peak": -1}
+
+# Synthetic stand-ins for what yt-dlp normally fetches: one progressive file,
+# one HLS rendition and a thumbnail, all held in memory. With ffmpeg they are
+# real (tiny) media so post-processing runs for real; without it random bytes.
+class EasyBenchMedia:
+    def __init__(self, size=256 * 1024, secs=4, segs=4):
+        self.ff = shutil.which("ffmpeg")
+        self.mp4, self.thumb, self.segs = None, None, []
+        if self.ff:
+            try: self._encode(secs)
+            except Exception as e: print(f"ffmpeg synth failed, using random bytes: {e}", file=sys.stderr); self.ff = None
+        if not self.ff:
+            self.mp4 = os.urandom(size)
+            self.segs = [(1.0, os.urandom(size // segs)) for _ in range(segs)]
+
+    def _encode(self, secs):
+        tmp = tempfile.mkdtemp(prefix="easy_bench_src_")
+        try:
+            run = lambda *a: subprocess.run([self.ff, "-v", "error", "-y", *a], check=True, capture_output=True)
+            src, thumb = os.path.join(tmp, "src.mp4"), os.path.join(tmp, "th.jpg")
+            run("-f", "lavfi", "-i", f"testsrc=size=320x180:rate=25:duration={secs}", "-f", "lavfi", "-i", f"sine=duration={secs}",
+                "-c:v", "libx264", "-preset", "ultrafast", "-g", "25", "-c:a", "aac", "-shortest", src)
+            run("-i", src, "-c", "copy", "-f", "hls", "-hls_time", "1", "-hls_list_size", "0",
+                "-hls_segment_filename", os.path.join(tmp, "seg%d.ts"), os.path.join(tmp, "index.m3u8"))
+            run("-f", "lavfi", "-i", "testsrc=size=320x180", "-frames:v", "1", thumb)
+            with open(src, "rb") as f: self.mp4 = f.read()
+            with open(thumb, "rb") as f: self.thumb = f.read()
+            dur = None
+            with open(os.path.join(tmp, "index.m3u8"), encoding="utf-8") as f:
+                for l in f:
+                    if l.startswith("#EXTINF:"): dur = float(l[8:].split(",")[0])
+                    elif l.strip() and not l.startswith("#"):
+                        with open(os.path.join(tmp, l.strip()), "rb") as s: self.segs.append((dur, s.read()))
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def m3u8(self):
+        lines = ["#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{int(max(d for d, _ in self.segs)) + 1}", "#EXT-X-MEDIA-SEQUENCE:0"]
+        for i, (d, _) in enumerate(self.segs): lines += [f"#EXTINF:{d:.3f},", f"seg{i}.ts"]
+        return ("\n".join(lines + ["#EXT-X-ENDLIST"]) + "\n").encode()
+
+    def feed(self, base, kind, n):
+        items = []
+        for i in range(n):
+            u = f"{base}/v/mp4-{i}.mp4" if kind == "mp4" else f"{base}/hls/{i}/hls-{i}.m3u8"
+            th = f'<itunes:image href="{base}/th/{i}.jpg"/>' if self.thumb else ""
+            items.append(f'<item><title>bench {kind} {i}</title><enclosure url="{escape(u)}" type="video/mp4"/>{th}</item>')
+        return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">'
+                f'<channel><title>bench {kind} x{n}</title>{"".join(items)}</channel></rss>').encode()
+
+class EasyBenchHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *a): pass
+
+    def _route(self):
+        m, base = self.server.media, f"http://{self.headers.get('Host')}"
+        p = self.path.split("?")[0].strip("/").split("/")
+        if p[0] == "feed" and len(p) == 3: return m.feed(base, p[1], int(p[2].split(".")[0])), "application/rss+xml"
+        if p[0] == "v": return m.mp4, "video/mp4"
+        if p[0] == "th" and m.thumb: return m.thumb, "image/jpeg"
+        if p[0] == "hls" and p[-1].endswith(".m3u8"): return m.m3u8(), "application/vnd.apple.mpegurl"
+        if p[0] == "hls" and p[-1].startswith("seg"):
+            k = int(p[-1][3:].split(".")[0])
+            if k < len(m.segs): return m.segs[k][1], "video/mp2t"
+        return None, None
+
+    def do_HEAD(self): self.do_GET(body=False)
+
+    def do_GET(self, body=True):
+        data, ctype = self._route()
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        s, e, code = 0, len(data) - 1, 200
+        rng = self.headers.get("Range", "")
+        if rng.startswith("bytes="):
+            a, _, b = rng[6:].split(",")[0].partition("-")
+            s, e, code = int(a or 0), min(int(b) if b else e, e), 206
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(e - s + 1))
+        if code == 206: self.send_header("Content-Range", f"bytes {s}-{e}/{len(data)}")
+        self.end_headers()
+        if body: self.wfile.write(data[s:e + 1])
+
+class EasyBenchServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, media, port=0):
+        super().__init__(("127.0.0.1", port), EasyBenchHandler)
+        self.media = media
+        self.base = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+def _rss():
+    try:
+        proc = lazy("psutil").Process()
+        return lambda: proc.memory_info().rss
+    except ImportError:
+        import resource
+        return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _pcts(xs):
+    return {'p50': round(percentile(xs, 50), 4), 'p90': round(percentile(xs, 90), 4), 'p99': round(percentile(xs, 99), 4), 'max': round(max(xs, default=0), 4)}
+
+# One scale of the whole headless path: scan the feed, queue every entry,
+# download, post-process, persist. The 33 ms drain loop stands in for the
+# GUI's signal processor so bus traffic is counted the way the UI sees it.
+def bench(srv, kind, n, args, rss):
+    tmp = tempfile.mkdtemp(prefix="easy_bench_")
+    lock, done = threading.Lock(), threading.Condition()
+    bus, sent, lat, phases, states = [0], {}, [], {}, {}
+    def on_event(sig):
+        now = time.perf_counter()
+        with lock:
+            bus[0] += 1
+            if sig['type'] == 't':
+                for k, v in sig['v'].items(): phases.setdefault(k, []).append(v)
+        if sig['type'] == 's' and sig['v'] in ('done', 'failed', 'cancelled', 'skipped'):
+            with done:
+                states[sig['id']] = sig['v']
+                if sig['id'] in sent: lat.append(now - sent[sig['id']])
+                done.notify_all()
+
+    prof = EasyProfiler(args.profile)
+    eng = EasyEngine(os.path.join(tmp, "core.db"), args.workers, args.workers, on_event=on_event, post_workers=args.post_workers, profiler=prof)
+    post = bool(srv.media.ff) and not args.no_post
+    cfg = dict(DEFAULTS, path=os.path.join(tmp, "out"), ext="mp4", opt_sponsor=False, opt_aac=post, opt_thumb=post and bool(srv.media.thumb), opt_subs=False)
+    peak, stop = [rss()], threading.Event()
+    def ui():
+        while not stop.wait(0.033):
+            k = len(eng.progress.drain())
+            with lock: bus[0] += k
+            peak[0] = max(peak[0], rss())
+    threading.Thread(target=ui, daemon=True).start()
+    rss0, rows0 = peak[0], eng.db.rows_written
+
+    t0 = time.perf_counter()
+    meta = eng.scan(f"{srv.base}/feed/{kind}/{n}.xml")
+    scan_s = time.perf_counter() - t0
+    for e in meta['entries']:
+        tid = str(uuid.uuid4())
+        sent[tid] = time.perf_counter()
+        eng.submit(e.get('title'), e['url'], cfg, tid=tid)
+    with done:
+        while len(states) < len(sent): done.wait(1)
+    wall = time.perf_counter() - t0
+    eng.close()
+    stop.set()
+
+    nbytes = sum(os.path.getsize(os.path.join(r, f)) for r, _, fs in os.walk(cfg['path']) for f in fs)
+    ok = sum(v == 'done' for v in states.values())
+    res = {"kind": kind, "items": n, "ok": ok, "failed": len(states) - ok, "post": post, "wall_s": round(wall, 3), "scan_s": round(scan_s, 3),
+           "items_per_s": round(ok / wall, 3), "bytes": nbytes, "bytes_per_s": round(nbytes / wall), "latency": _pcts(lat),
+           "phases": {k: _pcts(v) for k, v in phases.items()}, "rss_start": rss0, "rss_peak": peak[0],
+           "bus_msgs": bus[0], "bus_per_s": round(bus[0] / wall, 1), "db_rows": eng.db.rows_written - rows0,
+           "db_rows_per_s": round((eng.db.rows_written - rows0) / wall, 1), "db_commits": eng.db.commits,
+           "sessions": eng.pool.stats(), "stages": eng.io.stats()['stages']}
+    if args.profile: res["profile"] = {"phases": prof.stats(), "hot": prof.hot(args.top)}
+    if args.keep: res["dir"] = tmp
+    else: shutil.rmtree(tmp, ignore_errors=True)
+    return res
+
+def _version():
+    try: return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True).stdout.strip()
+    except Exception: return ""
+
+def _get(run, path):
+    for k in path.split("."):
+        run = (run or {}).get(k)
+    return run
+
+def compare(old_path, new_path, threshold):
+    with open(old_path, encoding="utf-8") as f: old = json.load(f)
+    with open(new_path, encoding="utf-8") as f: new = json.load(f)
+    print(f"{old.get('version') or old_path} -> {new.get('version') or new_path}")
+    base = {(r['kind'], r['items']): r for r in old['runs']}
+    worse = 0
+    for r in new['runs']:
+        o = base.get((r['kind'], r['items']))
+        if not o: continue
+        for m, sign in METRICS.items():
+            a, b = _get(o, m), _get(r, m)
+            if not a or b is None: continue
+            d = (b - a) / a * 100
+            bad = d * sign < -threshold
+            worse += bad
+            print(f"{r['kind']:>4} x{r['items']:<5} {m:<22} {a:>12.4g} -> {b:<12.4g} {d:+7.1f}%" + ("  REGRESSION" if bad else ""))
+    return 1 if worse else 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="easy_bench", description="Offline benchmark of the headless scan -> queue -> download -> post-process -> EasyStorage path.")
+    ap.add_argument("--scales", default="1,10,100,1000", help="comma separated item counts")
+    ap.add_argument("--kinds", default=",".join(KINDS), help="media kinds to serve: mp4 (progressive), hls")
+    ap.add_argument("-j", "--workers", type=int, default=3, help="concurrent download workers")
+    ap.add_argument("--post-workers", type=int, default=None, help="concurrent post-processing jobs (default: CPU count)")
+    ap.add_argument("--size", type=int, default=256 * 1024, help="bytes per synthetic file when ffmpeg is not available")
+    ap.add_argument("--no-post", action="store_true", help="skip AAC/thumbnail post-processing even when ffmpeg is available")
+    ap.add_argument("--profile", choices=["time", "cprofile"], default="", help="per-phase timing, optionally with cProfile")
+    ap.add_argument("--top", type=int, default=25, help="hottest functions to keep with --profile cprofile")
+    ap.add_argument("--keep", action="store_true", help="keep each run's temp directory")
+    ap.add_argument("-o", "--out", default="", help="results file (default easy_bench_<timestamp>.json)")
+    ap.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two results files instead of running")
+    ap.add_argument("--threshold", type=float, default=10, help="percent change that counts as a regression in --compare")
+    args = ap.parse_args(argv)
+
+    if args.compare: return compare(*args.compare, args.threshold)
+
+    lazy("yt_dlp"); lazy("easy_postproc")
+    srv = EasyBenchServer(EasyBenchMedia(args.size))
+    rss = _rss()
+    out = {"version": _version(), "ts": datetime.datetime.now().isoformat(" ", "seconds"), "python": platform.python_version(),
+           "yt_dlp": lazy("yt_dlp").version.__version__, "platform": platform.platform(), "ffmpeg": bool(srv.media.ff),
+           "args": {k: v for k, v in vars(args).items() if k not in ("compare", "out")}, "runs": []}
+    for kind in [k for k in args.kinds.split(",") if k in KINDS]:
+        for n in [int(x) for x in args.scales.split(",") if x.strip()]:
+            r = bench(srv, kind, n, args, rss)
+            out["runs"].append(r)
+            print(f"{kind:>4} x{n:<5} {r['ok']}/{n} ok | {r['wall_s']:.2f}s | {r['items_per_s']:.2f} items/s | {fmt_bytes(r['bytes_per_s'])}/s"
+                  f" | p50 {r['latency']['p50']:.2f}s p99 {r['latency']['p99']:.2f}s | RSS {fmt_bytes(r['rss_peak'])}"
+                  f" | BUS {r['bus_per_s']:.0f}/s | DB {r['db_rows_per_s']:.0f} rows/s | SESSIONS {r['sessions']['created']}+{r['sessions']['reused']}", flush=True)
+    srv.shutdown()
+    path = args.out or f"easy_bench_{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+    with open(path, "w", encoding="utf-8") as f: json.dump(out, f, indent=1)
+    print(f"results -> {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
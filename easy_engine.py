@@ -0,0 +1,1196 @@
+import os
+import re
+import sys
+import json
+import threading
+import time
+import sqlite3
+import importlib
+import argparse
+import uuid
+import datetime
+import copy
+import itertools
+import queue
+import urllib.parse
+from collections import deque, OrderedDict
+from pathlib import Path
+
+IMPORT_TIMES = {}
+
+DEFAULTS = {
+    "target_id": "",
+    "target_res": "",
+    "ext": "mp4",
+    "path": str(Path.home() / "Downloads"),
+    "t_start": "00:00:00",
+    "t_end": "00:00:10",
+    "opt_sponsor": True,
+    "opt_aac": True,
+    "opt_thumb": True,
+    "opt_gpu": True,
+    "opt_subs": False,
+    "opt_precise": False
+}
+
+EXIT_OK, EXIT_FAILED, EXIT_CANCELLED, EXIT_SKIPPED = 0, 1, 2, 3
+
+def lazy(name):
+    mod = sys.modules.get(name)
+    if mod is None or getattr(getattr(mod, '__spec__', None), '_initializing', False):
+        t = time.perf_counter()
+        mod = importlib.import_module(name)
+        IMPORT_TIMES[name] = time.perf_counter() - t
+    return mod
+
+def t_parse(ts):
+    try:
+        v = list(map(int, ts.split(':')))
+        if len(v) == 3: return v[0]*3600 + v[1]*60 + v[2]
+        return v[0]*60 + v[1]
+    except: return 0
+
+def clip_parse(s):
+    a, _, b = s.strip().replace(' ', '').partition('-')
+    c = [t_parse(a), t_parse(b)] if a and b else None
+    return c if c and c[1] > c[0] else None
+
+def clip_list(cfg):
+    clips = cfg.get('clips') or ([cfg['range']] if cfg.get('range') else [])
+    return sorted({(s, e) for s, e in clips if e > s})
+
+# Clips closer than CLIP_GAP seconds share one fetched span; re-reading a short
+# gap is cheaper than another seek/connection on the source.
+CLIP_GAP = 10
+
+def clip_spans(clips, gap=CLIP_GAP):
+    out = []
+    for s, e in sorted(clips):
+        if out and s - out[-1][1] <= gap: out[-1][1] = max(out[-1][1], e)
+        else: out.append([s, e])
+    return [tuple(x) for x in out]
+
+def rate_parse(s):
+    m = re.match(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)', str(s or '').upper())
+    return int(float(m.group(1)) * 1024 ** " KMG".index(m.group(2) or " ")) if m else 0
+
+def window_parse(s):
+    out = []
+    for part in re.split(r'[,;\n]+', s or ''):
+        m = re.match(r'\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*=\s*(\S+)', part)
+        if m:
+            h1, m1, h2, m2 = map(int, m.groups()[:4])
+            out.append((h1 * 60 + m1, h2 * 60 + m2, rate_parse(m.group(5))))
+    return out
+
+def percentile(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q / 100 * len(xs)))] if xs else 0.0
+
+def fmt_bytes(n):
+    for u in ("B", "KiB", "MiB", "GiB"):
+        if abs(n) < 1024: return f"{n:.1f}{u}"
+        n /= 1024
+    return f"{n:.1f}TiB"
+
+def fmt_eta(s):
+    if s is None: return "--:--"
+    s = int(s)
+    return f"{s // 3600}:{s // 60 % 60:02d}:{s % 60:02d}" if s >= 3600 else f"{s // 60:02d}:{s % 60:02d}"
+
+class EasyStorage:
+    def __init__(self, db_path="ytdlp_easy_gui_core.db", batch=500, linger=0.25):
+        self.db_path = db_path
+        self.batch, self.linger = batch, linger
+        self.q = queue.Queue()
+        self.local = threading.local()
+        self.fts = False
+        self.rows_written = self.commits = 0
+        self._init_db()
+        threading.Thread(target=self._writer, daemon=True).start()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS downloads (
+                    id TEXT PRIMARY KEY,
+                    title TEXT,
+                    url TEXT,
+                    timestamp DATETIME,
+                    container TEXT,
+                    resolution TEXT,
+                    status TEXT,
+                    file_path TEXT
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, val TEXT)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue (
+                    id TEXT PRIMARY KEY,
+                    title TEXT,
+                    url TEXT,
+                    prio INTEGER,
+                    cfg TEXT,
+                    state TEXT,
+                    created DATETIME,
+                    updated DATETIME
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archive (
+                    key TEXT,
+                    profile TEXT,
+                    bytes INTEGER,
+                    timestamp DATETIME,
+                    PRIMARY KEY (key, profile)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS downloads_url ON downloads (url)")
+            conn.execute("CREATE INDEX IF NOT EXISTS downloads_ts ON downloads (timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS downloads_status ON downloads (status, timestamp)")
+            try:
+                fresh = not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'downloads_fts'").fetchone()
+                conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS downloads_fts USING fts5(title, content='downloads', content_rowid='rowid')")
+                conn.execute("""CREATE TRIGGER IF NOT EXISTS downloads_ai AFTER INSERT ON downloads BEGIN
+                    INSERT INTO downloads_fts(rowid, title) VALUES (new.rowid, new.title); END""")
+                conn.execute("""CREATE TRIGGER IF NOT EXISTS downloads_ad AFTER DELETE ON downloads BEGIN
+                    INSERT INTO downloads_fts(downloads_fts, rowid, title) VALUES ('delete', old.rowid, old.title); END""")
+                conn.execute("""CREATE TRIGGER IF NOT EXISTS downloads_au AFTER UPDATE OF title ON downloads BEGIN
+                    INSERT INTO downloads_fts(downloads_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+                    INSERT INTO downloads_fts(rowid, title) VALUES (new.rowid, new.title); END""")
+                if fresh: conn.execute("INSERT INTO downloads_fts(downloads_fts) VALUES ('rebuild')")
+                self.fts = True
+            except sqlite3.OperationalError:
+                self.fts = False
+
+    def _conn(self):
+        c = getattr(self.local, "conn", None)
+        if c is None:
+            c = self.local.conn = sqlite3.connect(self.db_path)
+            c.execute("PRAGMA synchronous=NORMAL")
+        return c
+
+    def _writer(self):
+        conn = self._conn()
+        while True:
+            ops = [self.q.get()]
+            deadline = time.monotonic() + self.linger
+            while len(ops) < self.batch:
+                try: ops.append(self.q.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty: break
+            waiters = [op for op in ops if isinstance(op, threading.Event)]
+            ops = [op for op in ops if not isinstance(op, threading.Event)]
+            try:
+                with conn:
+                    for sql, group in itertools.groupby(ops, key=lambda op: op[0]):
+                        conn.executemany(sql, [op[1] for op in group])
+                self.rows_written += len(ops)
+                self.commits += 1
+            except Exception as e:
+                # the batch was rolled back: replay it one statement at a time so only the bad row is lost
+                print(f"Storage batch failed ({e}), retrying row by row", file=sys.stderr)
+                for sql, params in ops:
+                    try:
+                        with conn: conn.execute(sql, params)
+                        self.rows_written += 1
+                        self.commits += 1
+                    except Exception as e:
+                        print(f"Storage write failed: {e}", file=sys.stderr)
+            for w in waiters: w.set()
+
+    def _write(self, sql, params):
+        self.q.put((sql, params))
+
+    def flush(self, timeout=10):
+        ev = threading.Event()
+        self.q.put(ev)
+        ev.wait(timeout)
+
+    def log_transaction(self, t, u, c, r, s, p):
+        self._write("INSERT INTO downloads VALUES (?,?,?,?,?,?,?,?)",
+                    (str(uuid.uuid4()), t, u, datetime.datetime.now().isoformat(" "), c, r, s, p))
+
+    def queue_put(self, tid, t, u, prio, cfg, state):
+        now = datetime.datetime.now().isoformat(" ")
+        self._write("INSERT OR REPLACE INTO queue VALUES (?,?,?,?,?,?,?,?)", (tid, t, u, prio, json.dumps(cfg), state, now, now))
+
+    def queue_state(self, tid, state):
+        if state in ('done', 'cancelled', 'skipped'): self._write("DELETE FROM queue WHERE id = ?", (tid,))
+        else: self._write("UPDATE queue SET state = ?, updated = ? WHERE id = ?", (state, datetime.datetime.now().isoformat(" "), tid))
+
+    def queue_load(self):
+        self.flush()
+        try:
+            rows = self._conn().execute("SELECT id, title, url, prio, cfg, state FROM queue ORDER BY created").fetchall()
+            return [(tid, t, u, prio, json.loads(cfg), state) for tid, t, u, prio, cfg, state in rows]
+        except:
+            return []
+
+    def archive_load(self):
+        return self._conn().execute("SELECT key, profile, bytes FROM archive").fetchall()
+
+    def archive_put(self, key, profile, nbytes):
+        self._write("INSERT OR REPLACE INTO archive VALUES (?,?,?,?)", (key, profile, nbytes, datetime.datetime.now().isoformat(" ")))
+
+    def _match(self, q):
+        if self.fts: return " ".join('"' + w.replace('"', '""') + '"*' for w in q.split())
+        return f"%{q.strip()}%"
+
+    def history(self, q="", after=None, limit=50):
+        cols = "d.rowid, d.title, d.url, d.timestamp, d.container, d.resolution, d.status, d.file_path"
+        where, args = [], []
+        if q.strip():
+            if self.fts:
+                where.append("d.rowid IN (SELECT rowid FROM downloads_fts WHERE downloads_fts MATCH ?)")
+            else:
+                where.append("d.title LIKE ?")
+            args.append(self._match(q))
+        if after:
+            where.append("(d.timestamp, d.rowid) < (?, ?)")
+            args += list(after)
+        sql = f"SELECT {cols} FROM downloads d {'WHERE ' + ' AND '.join(where) if where else ''} ORDER BY d.timestamp DESC, d.rowid DESC LIMIT ?"
+        try: return self._conn().execute(sql, args + [limit]).fetchall()
+        except sqlite3.OperationalError: return []
+
+    def history_count(self, q=""):
+        try:
+            if not q.strip(): return self._conn().execute("SELECT COUNT(*) FROM downloads").fetchone()[0]
+            if self.fts: return self._conn().execute("SELECT COUNT(*) FROM downloads_fts WHERE downloads_fts MATCH ?", (self._match(q),)).fetchone()[0]
+            return self._conn().execute("SELECT COUNT(*) FROM downloads WHERE title LIKE ?", (self._match(q),)).fetchone()[0]
+        except sqlite3.OperationalError: return 0
+
+class EasyMetaCache:
+    TRACKING = ('si', 'feature', 'pp', 'ab_channel', 'fbclid', 'gclid')
+
+    def __init__(self, db_path, ttl=3600, max_items=256, max_bytes=64 * 1024 * 1024):
+        self.db_path = db_path
+        self.ttl, self.max_items, self.max_bytes = ttl, max_items, max_bytes
+        self.lock = threading.Lock()
+        self.mem = OrderedDict()
+        self.hits = self.misses = 0
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, ts REAL, atime REAL, size INTEGER, info TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS alias (url TEXT PRIMARY KEY, key TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS meta_atime ON meta (atime)")
+
+    @classmethod
+    def normalize(cls, u):
+        p = urllib.parse.urlsplit(u.strip())
+        host = (p.hostname or "").lower()
+        if host.startswith("www."): host = host[4:]
+        if p.port: host = f"{host}:{p.port}"
+        q = sorted((k, v) for k, v in urllib.parse.parse_qsl(p.query, keep_blank_values=True)
+                   if not k.startswith("utm_") and k not in cls.TRACKING)
+        return urllib.parse.urlunsplit((p.scheme.lower() or "https", host, p.path.rstrip("/") or "/", urllib.parse.urlencode(q), ""))
+
+    @staticmethod
+    def ident(info):
+        if info.get('extractor_key') and info.get('id'): return f"{info['extractor_key']}:{info['id']}"
+        return None
+
+    def get(self, u):
+        k, now = self.normalize(u), time.time()
+        with self.lock:
+            hit = self.mem.get(k)
+            if hit and now - hit[0] < self.ttl:
+                self.mem.move_to_end(k)
+                self.hits += 1
+                return hit[1]
+        row = None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("SELECT m.key, m.ts, m.info FROM alias a JOIN meta m ON m.key = a.key WHERE a.url = ?", (k,)).fetchone()
+                if row and now - row[1] < self.ttl: conn.execute("UPDATE meta SET atime = ? WHERE key = ?", (now, row[0]))
+        except:
+            pass
+        with self.lock:
+            if not row or now - row[1] >= self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            info = json.loads(row[2])
+            self._remember(k, row[1], info)
+            return info
+
+    def put(self, u, info):
+        info = lazy("yt_dlp").YoutubeDL.sanitize_info(info)
+        now = time.time()
+        urls = {self.normalize(x) for x in (u, info.get('webpage_url'), info.get('original_url')) if x}
+        key = self.ident(info) or self.normalize(u)
+        with self.lock:
+            for x in urls: self._remember(x, now, info)
+        try:
+            blob = json.dumps(info)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES (?,?,?,?,?)", (key, now, now, len(blob), blob))
+                conn.executemany("INSERT OR REPLACE INTO alias VALUES (?,?)", [(x, key) for x in urls])
+                self._evict(conn)
+        except:
+            pass
+
+    def _remember(self, k, ts, info):
+        self.mem[k] = (ts, info)
+        self.mem.move_to_end(k)
+        while len(self.mem) > self.max_items: self.mem.popitem(last=False)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM meta").fetchone()[0]
+        if total <= self.max_bytes: return
+        for key, size in conn.execute("SELECT key, size FROM meta ORDER BY atime").fetchall():
+            if total <= self.max_bytes: break
+            conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            total -= size
+        conn.execute("DELETE FROM alias WHERE key NOT IN (SELECT key FROM meta)")
+
+    def stats(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.mem)}
+
+class EasyArchive:
+    def __init__(self, db):
+        self.db = db
+        self.lock = threading.Lock()
+        self.known = {(k, p): b or 0 for k, p, b in db.archive_load()}
+        self.skipped = self.saved = 0
+
+    @staticmethod
+    def key(info):
+        ek = info.get('extractor_key') or info.get('ie_key')
+        if not ek or not info.get('id'): return None
+        return f"{ek.lower()} {info['id']}"
+
+    @staticmethod
+    def profile(cfg):
+        clips = clip_list(cfg)
+        p = f"{os.path.abspath(cfg['path'])}|{cfg['ext']}|{cfg.get('target_res') or ''}"
+        if clips: p += "|" + ",".join(f"{s}-{e}" for s, e in clips) + ("|precise" if cfg.get('opt_precise') else "")
+        return p
+
+    def check(self, key, profile):
+        with self.lock:
+            b = self.known.get((key, profile))
+            if b is None: return False
+            self.skipped += 1
+            self.saved += b
+            return True
+
+    def record(self, key, profile, nbytes):
+        with self.lock:
+            if nbytes or (key, profile) not in self.known: self.known[(key, profile)] = nbytes
+            else: return
+        self.db.archive_put(key, profile, nbytes)
+
+    def view(self, profile):
+        return EasyArchiveView(self, profile)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.known), 'skipped': self.skipped, 'saved': self.saved}
+
+class EasyArchiveView:
+    def __init__(self, archive, profile):
+        self.archive, self.profile = archive, profile
+        self.hits = 0
+
+    def __contains__(self, key):
+        hit = self.archive.check(key, self.profile)
+        self.hits += hit
+        return hit
+
+    def add(self, key):
+        self.archive.record(key, self.profile, 0)
+
+class EasyProgress:
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.latest = {}
+        self.last = {}
+        self.speeds = {}
+
+    def publish(self, tid, d):
+        now = time.monotonic()
+        if now - self.last.get(tid, 0) < self.interval: return
+        self.last[tid] = now
+        done = d.get('downloaded_bytes') or 0
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        if total: pct = min(done / total, 1.0)
+        elif d.get('fragment_count'): pct = (d.get('fragment_index') or 0) / d['fragment_count']
+        else: pct = 0.0
+        self.speeds[tid] = d.get('speed') or 0
+        with self.lock:
+            self.latest[tid] = {'v': pct, 's': d.get('speed') or 0, 'e': d.get('eta'), 'b': done, 't': total}
+
+    def drain(self):
+        with self.lock:
+            out, self.latest = self.latest, {}
+        return out
+
+    # transfer over (the task may still be post-processing): stop counting its speed
+    def idle(self, tid):
+        self.speeds.pop(tid, None)
+
+    def forget(self, tid):
+        self.last.pop(tid, None)
+        self.speeds.pop(tid, None)
+        with self.lock:
+            self.latest.pop(tid, None)
+
+    def aggregate(self):
+        return sum(list(self.speeds.values()))
+
+    def rates(self):
+        return dict(self.speeds)
+
+class EasyStageStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.passes = self.legacy = self.written = self.saved = 0
+
+    def add(self, name, secs, nbytes):
+        with self.lock:
+            s = self.stages.setdefault(name, [0, 0.0, 0])
+            s[0] += 1; s[1] += secs; s[2] += nbytes
+
+    def plan(self, legacy, passes, nbytes):
+        with self.lock:
+            self.legacy += legacy
+            self.passes += passes
+            self.written += passes * nbytes
+            self.saved += max(legacy - passes, 0) * nbytes
+
+    def stats(self):
+        with self.lock:
+            return {'stages': {k: {'runs': v[0], 'seconds': round(v[1], 3), 'bytes': v[2]} for k, v in self.stages.items()},
+                    'passes': self.passes, 'legacy_passes': self.legacy, 'written': self.written, 'saved': self.saved}
+
+# One token bucket shared by every transfer (fed from the progress hooks, so a
+# worker that overdraws sleeps off its own debt) plus a per-host hill climb
+# over concurrent_fragment_downloads driven by measured task throughput.
+class EasyBandwidth:
+    OPTS = {'http_chunk_size': 10 << 20, 'retries': 10, 'fragment_retries': 10, 'file_access_retries': 3,
+            'extractor_retries': 3, 'socket_timeout': 20,
+            'retry_sleep_functions': {'http': lambda n: min(2 ** n, 30), 'fragment': lambda n: min(2 ** n, 30)}}
+
+    def __init__(self, rate=0, schedule="", max_frag=8):
+        self.lock = threading.Lock()
+        self.rate, self.windows, self.max_frag = 0, [], 8
+        self.configure(rate, schedule, max_frag)
+        self.tokens, self.stamp = 0.0, time.monotonic()
+        self.throttled = 0.0
+        self.hosts = {}
+
+    def configure(self, rate=None, schedule=None, max_frag=None):
+        with self.lock:
+            if rate is not None: self.rate = rate_parse(rate)
+            if schedule is not None: self.windows = window_parse(schedule)
+            if max_frag: self.max_frag = max(1, int(max_frag))
+
+    def limit(self):
+        now = datetime.datetime.now()
+        m = now.hour * 60 + now.minute
+        for a, b, r in self.windows:
+            if (a <= m < b) if a <= b else (m >= a or m < b): return r
+        return self.rate
+
+    def consume(self, n, check=None):
+        rate = self.limit()
+        if not rate or n <= 0: return 0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.tokens + (now - self.stamp) * rate, rate)
+            self.stamp = now
+            self.tokens -= n
+            wait = -self.tokens / rate if self.tokens < 0 else 0
+            self.throttled += wait
+        end = time.monotonic() + wait
+        while wait > 0:
+            time.sleep(min(wait, 0.25))
+            if check: check()
+            wait = end - time.monotonic()
+        return end - now
+
+    def level(self, host):
+        with self.lock:
+            return min(self.hosts.setdefault(host, {'cur': 2, 'speed': {}})['cur'], self.max_frag)
+
+    def record(self, host, level, speed, throttled):
+        with self.lock:
+            h = self.hosts.setdefault(host, {'cur': 2, 'speed': {}})
+            sp = h['speed']
+            sp[level] = speed if level not in sp else sp[level] * 0.7 + speed * 0.3
+            best = max(sp, key=sp.get)
+            if throttled: h['cur'] = min(level, best)
+            elif best == max(sp) and best < self.max_frag: h['cur'] = best + 1
+            else: h['cur'] = best
+
+    def stats(self):
+        with self.lock:
+            return {'limit': self.limit(), 'throttled': self.throttled, 'levels': {k: v['cur'] for k, v in self.hosts.items()}}
+
+# Opt-in timing of the engine's hot paths (EASY_PROFILE=time), plus cProfile
+# with EASY_PROFILE=cprofile. cProfile follows one thread, so only one phase
+# is profiled at a time; overlapping ones are just timed.
+class EasyProfiler:
+    def __init__(self, mode=""):
+        self.mode = mode
+        self.lock, self.busy = threading.Lock(), threading.Lock()
+        self.times = {}
+        self.prof = lazy("cProfile").Profile() if mode == "cprofile" else None
+
+    def wrap(self, name, fn):
+        def run(*a, **kw):
+            hot = self.prof is not None and self.busy.acquire(blocking=False)
+            if hot: self.prof.enable()
+            t = time.perf_counter()
+            try: return fn(*a, **kw)
+            finally:
+                self.add(name, time.perf_counter() - t)
+                if hot:
+                    self.prof.disable()
+                    self.busy.release()
+        return run
+
+    def add(self, name, secs):
+        if not self.mode: return
+        with self.lock: self.times.setdefault(name, []).append(secs)
+
+    def stats(self):
+        with self.lock: times = {k: list(v) for k, v in self.times.items()}
+        return {k: {'n': len(v), 'total': round(sum(v), 3), 'p50': round(percentile(v, 50), 4), 'p90': round(percentile(v, 90), 4),
+                    'p99': round(percentile(v, 99), 4), 'max': round(max(v), 4)} for k, v in times.items()}
+
+    def hot(self, n=25):
+        if not self.prof: return []
+        with self.busy: st = lazy("pstats").Stats(self.prof).stats
+        rows = sorted(st.items(), key=lambda kv: -kv[1][2])[:n]
+        return [{'fn': f"{os.path.basename(f)}:{l}({fn})", 'calls': nc, 'tottime': round(tt, 4), 'cumtime': round(ct, 4)}
+                for (f, l, fn), (cc, nc, tt, ct, _) in rows]
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as f: json.dump({'phases': self.stats(), 'hot': self.hot()}, f, indent=1)
+        if self.prof:
+            with self.busy: self.prof.dump_stats(os.path.splitext(path)[0] + ".pstats")
+
+class EasySession:
+    def __init__(self, ydl=None):
+        self.ydl, self.uses = ydl, 0
+        self.hook = self.pp_hook = self.stage = self.reclaim = lambda *a: None
+
+# Long-lived YoutubeDL instances keyed by (host, option profile). A task checks
+# one out exclusively and rebinds the session's hook trampolines to itself, so
+# extractors, HTTP handlers (and their keep-alive pools) survive across tasks.
+# Every session shares one cookie jar.
+class EasyYDLPool:
+    def __init__(self, max_idle=8):
+        self.lock = threading.Lock()
+        self.idle = OrderedDict()
+        self.max_idle = max_idle
+        self.jar = None
+        self.created = self.reused = 0
+
+    def checkout(self, key, factory):
+        with self.lock:
+            free = self.idle.get(key)
+            if free:
+                s = free.pop()
+                if not free: del self.idle[key]
+                self.reused += 1
+                s.uses += 1
+                return s
+            self.created += 1
+        s = factory()
+        with self.lock:
+            if self.jar is None: self.jar = s.ydl.cookiejar
+            else: s.ydl.__dict__['cookiejar'] = self.jar
+        s.uses = 1
+        return s
+
+    def checkin(self, key, s):
+        s.hook = s.pp_hook = s.stage = s.reclaim = lambda *a: None
+        drop = []
+        with self.lock:
+            self.idle.setdefault(key, []).append(s)
+            self.idle.move_to_end(key)
+            while sum(map(len, self.idle.values())) > self.max_idle:
+                k, free = next(iter(self.idle.items()))
+                drop.append(free.pop(0))
+                if not free: del self.idle[k]
+        for d in drop: self.discard(d)
+
+    def discard(self, s):
+        try: s.ydl.close()
+        except: pass
+
+    def close(self):
+        with self.lock:
+            drop, self.idle = [s for free in self.idle.values() for s in free], OrderedDict()
+        for s in drop: self.discard(s)
+
+    def stats(self):
+        with self.lock:
+            return {'created': self.created, 'reused': self.reused, 'idle': sum(map(len, self.idle.values()))}
+
+class EasyInterrupt(Exception):
+    pass
+
+class EasyScheduler:
+    PRIO_SINGLE, PRIO_BULK = 0, 1
+
+    def __init__(self, limit=3, host_limit=2, observer=None, post_limit=None):
+        self.limit, self.host_limit = limit, host_limit
+        self.post_limit = max(1, post_limit or os.cpu_count() or 2)
+        self.observer = observer
+        self.cv = threading.Condition()
+        self.lanes = {}
+        self.tasks = {}
+        self.hosts = {}
+        self.running = 0
+        self.workers = 0
+        self.waiting = self.posting = self.back = 0
+        self.counts = {'done': 0, 'failed': 0, 'cancelled': 0, 'skipped': 0}
+
+    def submit(self, tid, fn, args=(), host="", prio=PRIO_BULK, state='queued'):
+        with self.cv:
+            self.tasks[tid] = {'fn': fn, 'args': args, 'host': host, 'prio': prio, 'state': state, 'flag': None, 'stage': None}
+            if state == 'queued':
+                self._enqueue(tid)
+                self._grow()
+                self.cv.notify()
+        self._emit(tid, state)
+
+    def configure(self, limit=None, host_limit=None, post_limit=None):
+        with self.cv:
+            if limit: self.limit = max(1, int(limit))
+            if host_limit: self.host_limit = max(1, int(host_limit))
+            if post_limit: self.post_limit = max(1, int(post_limit))
+            self._grow()
+            self.cv.notify_all()
+
+    def pause(self, tid):
+        with self.cv:
+            t = self.tasks.get(tid)
+            if not t: return
+            if t['state'] == 'queued': t['state'] = 'paused'
+            elif t['state'] in ('running', 'waiting'): t['flag'] = 'pause'; self.cv.notify_all(); return
+            else: return
+        self._emit(tid, 'paused')
+
+    def resume(self, tid):
+        with self.cv:
+            t = self.tasks.get(tid)
+            if not t: return
+            if t['state'] in ('running', 'waiting') and t['flag'] == 'pause': t['flag'] = None; return
+            if t['state'] not in ('paused', 'failed'): return
+            if t['state'] == 'failed': self.counts['failed'] -= 1
+            t['state'] = 'queued'
+            self._enqueue(tid, front=True)
+            self.cv.notify()
+        self._emit(tid, 'queued')
+
+    def cancel(self, tid):
+        with self.cv:
+            t = self.tasks.get(tid)
+            if not t: return
+            if t['state'] in ('running', 'waiting'): t['flag'] = 'cancel'; self.cv.notify_all(); return
+            if t['state'] not in ('queued', 'paused', 'failed'): return
+            # dismissing a failed task also drops its persisted queue row
+            if t['state'] == 'failed': self.counts['failed'] -= 1
+            t['state'] = 'cancelled'
+            self.counts['cancelled'] += 1
+        self._emit(tid, 'cancelled')
+
+    # Called from a download thread once its transfer is finished: it frees its
+    # download slot (an idle worker, or a new one, picks up the next download)
+    # and waits for one of post_limit post-processing slots. Afterwards the
+    # thread goes back to the pool.
+    def handoff(self, tid):
+        with self.cv:
+            t = self.tasks[tid]
+            if t['stage']: return
+            t['state'] = t['stage'] = 'waiting'
+            self.running -= 1
+            self.hosts[t['host']] -= 1
+            self.waiting += 1
+            self._grow()
+            self.cv.notify_all()
+        self._emit(tid, 'waiting')
+        with self.cv:
+            while self.posting >= self.post_limit and not t['flag']: self.cv.wait()
+            self.waiting -= 1
+            self.cv.notify_all()
+            if t['flag']: raise EasyInterrupt(t['flag'])
+            t['state'] = t['stage'] = 'processing'
+            self.posting += 1
+        self._emit(tid, 'processing')
+
+    # A ranged download runs process_info once per span, post-processing each as
+    # it lands. Before the next span transfers, the task gives its post slot back
+    # and queues for a download slot like any other transfer.
+    def reclaim(self, tid):
+        with self.cv:
+            t = self.tasks[tid]
+            if t['stage'] != 'processing': return
+            t['stage'], t['state'] = 'back', 'waiting'
+            self.posting -= 1
+            self.back += 1
+            self.cv.notify_all()
+            while (self.running >= self.limit or self.hosts.get(t['host'], 0) >= self.host_limit) and not t['flag']: self.cv.wait()
+            self.back -= 1
+            if t['flag']: raise EasyInterrupt(t['flag'])
+            t['state'], t['stage'] = 'running', None
+            self.running += 1
+            self.hosts[t['host']] = self.hosts.get(t['host'], 0) + 1
+        self._emit(tid, 'running')
+
+    def checkpoint(self, tid):
+        t = self.tasks.get(tid)
+        if t and t['flag']: raise EasyInterrupt(t['flag'])
+
+    def interrupted(self, tid):
+        t = self.tasks.get(tid)
+        return t['flag'] if t else None
+
+    def stats(self):
+        with self.cv:
+            s = dict(self.counts, queued=0, paused=0, running=self.running, waiting=self.waiting, processing=self.posting, lanes={})
+            for t in self.tasks.values():
+                if t['state'] in ('queued', 'paused'): s[t['state']] += 1
+                if t['state'] == 'queued': s['lanes'][t['prio']] = s['lanes'].get(t['prio'], 0) + 1
+            return s
+
+    def _emit(self, tid, state):
+        if self.observer: self.observer(tid, state)
+
+    def _enqueue(self, tid, front=False):
+        t = self.tasks[tid]
+        q = self.lanes.setdefault(t['prio'], {}).setdefault(t['host'], deque())
+        if front: q.appendleft(tid)
+        else: q.append(tid)
+
+    def _free(self):
+        return self.workers - self.waiting - self.posting - self.back
+
+    def _grow(self):
+        while self._free() < self.limit:
+            self.workers += 1
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def _next(self):
+        for prio in sorted(self.lanes):
+            lane = self.lanes[prio]
+            for host in list(lane):
+                if self.hosts.get(host, 0) >= self.host_limit: continue
+                q = lane[host]
+                while q:
+                    tid = q.popleft()
+                    if self.tasks[tid]['state'] != 'queued': continue
+                    if q: lane[host] = lane.pop(host)
+                    else: del lane[host]
+                    return tid
+                del lane[host]
+            if not lane: del self.lanes[prio]
+        return None
+
+    def _worker(self):
+        while True:
+            with self.cv:
+                while True:
+                    # idle threads are kept up to the most the two stages can hold at once
+                    # (every download slot handed off and waiting), so steady state spawns none
+                    if self._free() > self.limit and self.workers > 2 * (self.limit + self.post_limit):
+                        self.workers -= 1
+                        return
+                    tid = self._next() if self.running < self.limit and self.waiting < self.post_limit else None
+                    if tid: break
+                    self.cv.wait()
+                t = self.tasks[tid]
+                t['state'] = 'running'
+                self.running += 1
+                self.hosts[t['host']] = self.hosts.get(t['host'], 0) + 1
+            self._emit(tid, 'running')
+            try: ok = t['fn'](tid, *t['args'])
+            except Exception: ok = False
+            with self.cv:
+                stage, t['stage'] = t['stage'], None
+                if stage == 'processing': self.posting -= 1
+                elif stage is None:
+                    self.running -= 1
+                    self.hosts[t['host']] -= 1
+                f, t['flag'] = t['flag'], None
+                if f == 'cancel': t['state'] = 'cancelled'
+                elif f == 'pause': t['state'] = 'paused'
+                else: t['state'] = 'skipped' if ok == 'skipped' else 'done' if ok else 'failed'
+                if t['state'] in self.counts: self.counts[t['state']] += 1
+                st = t['state']
+                self.cv.notify_all()
+            self._emit(tid, st)
+
+def build_opts(cfg, hook):
+    ext = cfg["ext"]
+    v = cfg["target_id"] or "bv"
+
+    # Basic Format Selection (AAC audio first so the mp4 merge stays a stream copy; every alternative keeps the video)
+    aac = f"{v}+ba[acodec^=mp4a]/" if ext == 'mp4' and cfg["opt_aac"] else ""
+    opts = {
+        'format': f"{aac}{v}+ba/b",
+        'outtmpl': os.path.join(cfg["path"], "%(title)s.%(ext)s"),
+        'progress_hooks': [hook],
+        'continuedl': True,
+        'quiet': True,
+        'noprogress': True,
+        'postprocessors': []
+    }
+
+    # --- FIX: Handle Audio Extraction (MP3/WAV) ---
+    if ext in ['mp3', 'wav']:
+        opts['format'] = 'bestaudio/best'
+        opts['postprocessors'].append({
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': ext,
+            'preferredquality': '192',
+        })
+
+    # --- FIX: Handle Video Container (MP4/MKV) ---
+    elif ext in ['mp4', 'mkv']:
+        opts['merge_output_format'] = ext
+
+    # Temporal Clipping: fetch each merged span once (stream copy), EasyClipPP cuts the clips out of it
+    clips = clip_list(cfg)
+    if clips:
+        spans = clip_spans(clips)
+        opts['download_ranges'] = lambda info, ydl: [{'start_time': s, 'end_time': e} for s, e in spans]
+        opts['outtmpl'] = os.path.join(cfg["path"], "%(title)s.span-%(section_start)d.%(ext)s")
+
+    # SponsorBlock Logic (segments only; cuts, AAC, thumbnail and tags are planned by easy_postproc)
+    if cfg["opt_sponsor"] and not clips:
+        opts['postprocessors'].append({'key': 'SponsorBlock', 'categories': ['sponsor', 'intro', 'outro', 'selfpromo']})
+
+    # Thumbnail & Metadata Logic
+    if cfg["opt_thumb"]:
+        opts['writethumbnail'] = True
+
+    # Subtitles
+    if cfg["opt_subs"]:
+        opts['writesubtitles'] = True
+        opts['subtitleslangs'] = ['en.*']
+
+    return opts
+
+class EasyEngine:
+    def __init__(self, db_path="ytdlp_easy_gui_core.db", workers=3, host_limit=2, on_event=None, persist=True, post_workers=None, rate=0, schedule="", max_frag=8, profiler=None):
+        self.db = EasyStorage(db_path)
+        self.meta = EasyMetaCache(os.path.join(os.path.dirname(os.path.abspath(db_path)), "ytdlp_easy_gui_cache.db"))
+        self.progress = EasyProgress()
+        self.archive = EasyArchive(self.db)
+        self.sched = EasyScheduler(workers, host_limit, observer=self._on_state, post_limit=post_workers)
+        self.io = EasyStageStats()
+        self.bw = EasyBandwidth(rate, schedule, max_frag)
+        self.pool = EasyYDLPool()
+        self.on_event = on_event or (lambda sig: None)
+        self.persist = persist
+        self.prof = profiler or EasyProfiler(os.environ.get("EASY_PROFILE", ""))
+        self.prof_path = None if profiler else os.path.join(os.path.dirname(os.path.abspath(db_path)), "ytdlp_easy_gui_profile.json")
+        if self.prof.mode: self.scan, self.download = self.prof.wrap('scan', self.scan), self.prof.wrap('download', self.download)
+
+    def _on_state(self, tid, st):
+        if self.persist: self.db.queue_state(tid, st)
+        self.on_event({'id': tid, 'type': 's', 'v': st})
+
+    def submit(self, t, u, cfg, prio=EasyScheduler.PRIO_BULK, tid=None, state='queued', aid=None):
+        if aid and self.archive.check(aid, EasyArchive.profile(cfg)): return None
+        tid = tid or str(uuid.uuid4())
+        if self.persist: self.db.queue_put(tid, t, u, prio, cfg, state)
+        self.sched.submit(tid, self.download, (u, t, cfg), host=urllib.parse.urlsplit(u).hostname or "", prio=prio, state=state)
+        return tid
+
+    def pending(self):
+        return [(tid, t, u, prio, cfg, 'queued' if state in ('running', 'waiting', 'processing') else state) for tid, t, u, prio, cfg, state in self.db.queue_load()]
+
+    def session(self, key, opts):
+        return self.pool.checkout(key, lambda: EasySession(lazy("yt_dlp").YoutubeDL(opts)))
+
+    def close(self):
+        self.pool.close()
+        self.db.flush()
+        if self.prof.mode and self.prof_path: self.prof.dump(self.prof_path)
+
+    def scan(self, u, on_entries=None, alive=lambda: True):
+        meta = self.meta.get(u)
+        if meta is not None: return meta
+        key = ('scan', urllib.parse.urlsplit(u).hostname)
+        s = self.session(key, {'quiet': True, 'extract_flat': 'in_playlist', 'lazy_playlist': True})
+        try:
+            ydl = s.ydl
+            meta = ydl.extract_info(u, download=False, process=False)
+            for _ in range(3):
+                if meta.get('_type') != 'url': break
+                meta = ydl.extract_info(meta['url'], download=False, process=False, ie_key=meta.get('ie_key'))
+            if meta.get('_type') in ('playlist', 'multi_video'):
+                meta = self._stream_playlist(meta, on_entries, alive)
+            else:
+                meta = ydl.process_ie_result(meta, download=False)
+        except:
+            self.pool.discard(s)
+            raise
+        self.pool.checkin(key, s)
+        if meta is None: return None
+        self.meta.put(u, meta)
+        return meta
+
+    def _stream_playlist(self, meta, on_entries, alive):
+        ents = meta['entries']
+        if hasattr(ents, 'getpage'): ents = itertools.chain.from_iterable(itertools.takewhile(bool, map(ents.getpage, itertools.count())))
+        seen, batch, tick = [], [], time.monotonic()
+        if on_entries: on_entries([], False)
+        for e in ents:
+            if not alive(): return None
+            if not e: continue
+            batch.append(e)
+            if len(batch) >= 200 or time.monotonic() - tick > 0.25:
+                if on_entries: on_entries(batch, False)
+                seen.extend(batch); batch, tick = [], time.monotonic()
+        seen.extend(batch)
+        if on_entries: on_entries(batch, True)
+        return dict(meta, entries=seen)
+
+    def preview_url(self, u, fmt='best[height<=360]'):
+        info = self.meta.get(u)
+        key = ('preview', urllib.parse.urlsplit(u).hostname, fmt)
+        s = self.session(key, {'quiet': True, 'format': fmt})
+        try:
+            if info and info.get('formats'): url = s.ydl.process_ie_result(copy.deepcopy(info), download=False)['url']
+            else: url = s.ydl.extract_info(u, download=False)['url']
+        except:
+            self.pool.discard(s)
+            raise
+        self.pool.checkin(key, s)
+        return url
+
+    def _session_for(self, host, cfg, profile):
+        key = ('dl', host, profile, json.dumps([cfg.get(k) for k in ('target_id', 'opt_aac', 'opt_sponsor', 'opt_thumb', 'opt_subs')]))
+        def make():
+            post = lazy("easy_postproc")
+            spec = post.plan(cfg, clip_list(cfg))
+            s = EasySession()
+            opts = build_opts(cfg, lambda d: s.hook(d))
+            opts['download_archive'] = self.archive.view(profile)
+            opts['postprocessor_hooks'] = [lambda d: s.pp_hook(d)]
+            opts.update(EasyBandwidth.OPTS)
+            s.ydl = ydl = post.EasyYDL(opts)
+            ydl.stage, ydl.reclaim = (lambda: s.stage()), (lambda: s.reclaim())
+            ydl.add_post_processor(post.EasyPlanPP(ydl, spec), when='before_dl')
+            ydl.add_post_processor(post.EasyFinalizePP(ydl, spec, report=self.io.plan), when='post_process')
+            if spec['clips']: ydl.add_post_processor(post.EasyClipPP(ydl, spec), when='post_process')
+            return s
+        return key, make
+
+    def download(self, tid, u, t, cfg):
+        # a clip task without a usable range must fail, not quietly become a full download
+        if ('clips' in cfg or 'range' in cfg) and not clip_list(cfg):
+            self.on_event({'id': tid, 'type': 'e', 'v': "no valid clip range (END must be after START)"})
+            return False
+        host = urllib.parse.urlsplit(u).hostname or ""
+        level = self.bw.level(host)
+        marks, seen, waits = {'start': time.perf_counter()}, {}, [0.0]
+        check = lambda: self.sched.checkpoint(tid)
+        def h(d):
+            check()
+            b = d.get('downloaded_bytes') or 0
+            if d['status'] == 'downloading':
+                marks.setdefault('first', marks.setdefault('download', time.perf_counter()))
+                if d.get('fragment_count'): marks['frag'] = True
+                self.progress.publish(tid, d)
+                k = d.get('filename')
+                b, seen[k] = b - seen.get(k, 0), b
+                waits[0] += self.bw.consume(b, check)
+            elif d['status'] == 'finished' and 'download' in marks:
+                self.progress.idle(tid)
+                secs = time.perf_counter() - marks.pop('download')
+                n = d.get('total_bytes') or b
+                self.io.add('download', secs, n)
+                if marks.pop('frag', None): self.bw.record(host, level, n / secs, waits[0] > secs * 0.1)
+
+        def pp(d):
+            name = d.get('postprocessor')
+            if d['status'] == 'started': marks[name] = time.perf_counter()
+            elif d['status'] == 'finished' and name in marks:
+                p = (d.get('info_dict') or {}).get('filepath')
+                self.io.add(name, time.perf_counter() - marks.pop(name), os.path.getsize(p) if p and os.path.exists(p) else 0)
+
+        def stage():
+            marks['stage'] = time.perf_counter()
+            marks.setdefault('first', marks['stage'])
+            self.progress.idle(tid)
+            self.sched.handoff(tid)
+            marks['post'] = time.perf_counter()
+
+        profile = EasyArchive.profile(cfg)
+        s = None
+        try:
+            yt_dlp = lazy("yt_dlp")
+            info = self.meta.get(u)
+            key, make = self._session_for(host, cfg, profile)
+            s = self.pool.checkout(key, make)
+            s.hook, s.pp_hook, s.stage, s.reclaim = h, pp, stage, lambda: self.sched.reclaim(tid)
+            ydl = s.ydl
+            ydl.params['concurrent_fragment_downloads'] = level
+            view = ydl.params['download_archive']
+            hits, res = view.hits, None
+            if info and info.get('formats'):
+                try: res = ydl.process_ie_result(copy.deepcopy(info), download=True)
+                except yt_dlp.utils.DownloadError:
+                    if self.sched.interrupted(tid): raise
+                    res = ydl.extract_info(u)
+            else:
+                res = ydl.extract_info(u)
+                if res: self.meta.put(u, res)
+            # yt-dlp's own archive check caught it (entries without an id can't be checked before queueing);
+            # read before checkin, once pooled the view belongs to whoever takes the session next
+            skipped = view.hits > hits
+            self.pool.checkin(key, s)
+            s = None
+            if skipped:
+                self.progress.forget(tid)
+                return 'skipped'
+            self._timing(tid, marks)
+            if res and res.get('requested_downloads') and EasyArchive.key(res):
+                paths = [p for d in res['requested_downloads'] for p in d.get('clip_files') or [d.get('filepath')]]
+                self.archive.record(EasyArchive.key(res), profile, sum(os.path.getsize(p) for p in paths if p and os.path.exists(p)))
+            self.progress.forget(tid)
+            self.on_event({'id': tid, 'type': 'f'})
+            self.db.log_transaction(t, u, cfg["ext"], cfg["target_res"], "SUCCESS", cfg["path"])
+            return True
+        except Exception as e:
+            if s: self.pool.discard(s)
+            self.progress.forget(tid)
+            if self.sched.interrupted(tid): return False
+            self.on_event({'id': tid, 'type': 'e', 'v': str(e)})
+            return False
+
+    def _timing(self, tid, marks):
+        end = time.perf_counter()
+        first = marks.get('first', marks.get('stage', end))
+        stage, post = marks.get('stage', end), marks.get('post', end)
+        t = {'setup': first - marks['start'], 'transfer': max(stage - first, 0), 'wait': post - stage, 'post': end - post}
+        self.io.add('setup', t['setup'], 0)
+        for k, v in t.items(): self.prof.add(k, v)
+        self.on_event({'id': tid, 'type': 't', 'v': {k: round(v, 3) for k, v in t.items()}})
+
+def _read_urls(args):
+    urls = list(args.urls)
+    if args.input:
+        with (sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")) as f:
+            urls += [l.strip() for l in f if l.strip() and not l.lstrip().startswith("#")]
+    return urls
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="easy_engine", description="Headless YT-DLP Easy GUI engine. Emits JSON-lines progress on stdout.")
+    ap.add_argument("urls", nargs="*", help="media or playlist URLs")
+    ap.add_argument("-i", "--input", help="file with one URL per line ('-' for stdin)")
+    ap.add_argument("-j", "--workers", type=int, default=3, help="concurrent download workers")
+    ap.add_argument("--host-limit", type=int, default=2, help="concurrent downloads per host")
+    ap.add_argument("--post-workers", type=int, default=None, help="concurrent post-processing jobs (default: CPU count)")
+    ap.add_argument("-o", "--path", default=DEFAULTS["path"], help="output directory")
+    ap.add_argument("-f", "--ext", default=DEFAULTS["ext"], choices=["mp4", "mkv", "mp3", "wav"])
+    ap.add_argument("--format-id", default="", help="yt-dlp video format id to pair with bestaudio")
+    ap.add_argument("--no-aac", action="store_true")
+    ap.add_argument("--no-sponsor", action="store_true")
+    ap.add_argument("--no-thumb", action="store_true")
+    ap.add_argument("--subs", action="store_true")
+    ap.add_argument("--clip", action="append", default=[], metavar="START-END", help="cut HH:MM:SS-HH:MM:SS from every item (repeatable)")
+    ap.add_argument("--precise", action="store_true", help="re-encode clip starts that do not land on a keyframe")
+    ap.add_argument("--limit-rate", default="", metavar="RATE", help="shared bandwidth budget for all workers, e.g. 4M or 800K")
+    ap.add_argument("--schedule", default="", metavar="HH:MM-HH:MM=RATE,...", help="time-of-day budgets overriding --limit-rate (0 = unlimited)")
+    ap.add_argument("--max-fragments", type=int, default=8, help="upper bound for adaptive fragment parallelism")
+    ap.add_argument("--no-expand", action="store_true", help="do not expand playlists into individual items")
+    ap.add_argument("--db", default="ytdlp_easy_gui_core.db", help="EasyStorage database path")
+    ap.add_argument("--interval", type=float, default=0.5, help="seconds between progress lines")
+    args = ap.parse_args(argv)
+
+    urls = _read_urls(args)
+    if not urls:
+        ap.error("no URLs given")
+
+    out = threading.Lock()
+    def emit(obj):
+        with out:
+            sys.stdout.write(json.dumps(obj) + "\n")
+            sys.stdout.flush()
+
+    done, items = threading.Condition(), {}
+    def on_event(sig):
+        it = items.get(sig['id'])
+        if sig['type'] == 'e' and it: it['error'] = sig.get('v')
+        if sig['type'] == 't': emit(dict(sig['v'], event="timing", id=sig['id']))
+        if sig['type'] != 's': return
+        emit({"event": "state", "id": sig['id'], "state": sig['v']})
+        if sig['v'] in ('done', 'failed', 'cancelled', 'skipped'):
+            with done:
+                if it: it['state'] = sig['v']
+                done.notify_all()
+
+    eng = EasyEngine(args.db, args.workers, args.host_limit, on_event=on_event, persist=False, post_workers=args.post_workers,
+                      rate=args.limit_rate, schedule=args.schedule, max_frag=args.max_fragments)
+    cfg = dict(DEFAULTS, path=args.path, ext=args.ext, target_id=args.format_id, opt_aac=not args.no_aac,
+               opt_sponsor=not args.no_sponsor, opt_thumb=not args.no_thumb, opt_subs=args.subs, opt_precise=args.precise)
+    clips = [c for c in map(clip_parse, args.clip) if c]
+    if len(clips) != len(args.clip): ap.error("--clip expects START-END with END after START")
+    if clips: cfg['clips'] = clips
+
+    jobs = []
+    for u in urls:
+        if args.no_expand:
+            jobs.append((u, u, None))
+            continue
+        try: meta = eng.scan(u)
+        except Exception as e:
+            emit({"event": "result", "url": u, "status": "failed", "code": EXIT_FAILED, "error": str(e)})
+            items[u] = {'state': 'failed'}
+            continue
+        if 'entries' in meta: jobs += [(e.get('title') or e.get('url'), e.get('url') or e.get('webpage_url'), EasyArchive.key(e)) for e in meta['entries'] if e]
+        else: jobs.append((meta.get('title') or u, meta.get('webpage_url') or u, EasyArchive.key(meta)))
+
+    with done:
+        for t, u, aid in jobs:
+            tid = str(uuid.uuid4())
+            items[tid] = {'title': t, 'url': u, 'state': None}
+            if eng.submit(t, u, cfg, tid=tid, aid=aid) is None:
+                items[tid]['state'] = 'skipped'
+                continue
+            emit({"event": "queued", "id": tid, "url": u, "title": t})
+
+    try:
+        while True:
+            with done:
+                if all(it['state'] for it in items.values()): break
+                done.wait(args.interval)
+            for tid, st in eng.progress.drain().items():
+                emit({"event": "progress", "id": tid, "pct": round(st['v'] * 100, 1), "speed": st['s'], "eta": st['e'], "bytes": st['b'], "total": st['t']})
+    except KeyboardInterrupt:
+        for tid in list(items):
+            if tid in eng.sched.tasks: eng.sched.cancel(tid)
+        with done:
+            while not all(it['state'] for it in items.values()): done.wait(1)
+
+    codes = {'done': EXIT_OK, 'failed': EXIT_FAILED, 'cancelled': EXIT_CANCELLED, 'skipped': EXIT_SKIPPED}
+    for tid, it in items.items():
+        if 'url' not in it: continue
+        r = {"event": "result", "id": tid, "url": it['url'], "title": it['title'], "status": it['state'], "code": codes[it['state']]}
+        if it.get('error'): r["error"] = it['error']
+        emit(r)
+    a, io, bw, pool = eng.archive.stats(), eng.io.stats(), eng.bw.stats(), eng.pool.stats()
+    emit({"event": "summary", "skipped": a['skipped'], "saved_bytes": a['saved'], "pp_passes": io['passes'],
+          "pp_legacy_passes": io['legacy_passes'], "pp_written_bytes": io['written'], "pp_saved_bytes": io['saved'], "stages": io['stages'],
+          "throttled_seconds": round(bw['throttled'], 2), "fragment_levels": bw['levels'],
+          "sessions_created": pool['created'], "sessions_reused": pool['reused']})
+    eng.close()
+    return EXIT_OK if all(it['state'] in ('done', 'skipped') for it in items.values()) else EXIT_FAILED
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import os
+import subprocess
+from yt_dlp import YoutubeDL
+from yt_dlp.postprocessor.common import PostProcessor
+from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+from yt_dlp.utils import Popen, prepend_extension
+
+SPONSOR_CUTS = ['sponsor', 'intro', 'outro', 'selfpromo']
+AAC_ARGS = ['-c:a', 'aac', '-b:a', '192k']
+THUMB_EXTS = ('mp4', 'm4a', 'mkv', 'mka', 'mp3')
+MIME = {'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'png': 'image/png', 'webp': 'image/webp'}
+
+def plan(cfg, clips=()):
+    ext = cfg["ext"]
+    return {
+        'ext': ext,
+        'aac': ext == 'mp4' and bool(cfg["opt_aac"]),
+        'cuts': SPONSOR_CUTS if cfg["opt_sponsor"] and not clips else [],
+        'clips': list(clips),
+        'precise': bool(cfg.get("opt_precise")),
+        'thumb': bool(cfg["opt_thumb"]) and ext in THUMB_EXTS,
+        'meta': bool(cfg["opt_thumb"]),
+    }
+
+def tags(info):
+    url = info.get('webpage_url')
+    t = {
+        'title': info.get('track') or info.get('title'),
+        'artist': info.get('artist') or info.get('creator') or info.get('uploader'),
+        'date': info.get('upload_date'),
+        'description': info.get('description'),
+        'synopsis': info.get('description'),
+        'purl': url,
+        'comment': url,
+    }
+    return {k: str(v) for k, v in t.items() if v}
+
+def hms(t):
+    t = int(t)
+    return f"{t // 3600:02d}-{t // 60 % 60:02d}-{t % 60:02d}"
+
+def is_aac(codec):
+    return (codec or '').split('.')[0] in ('mp4a', 'aac')
+
+def _esc(s):
+    for c in '\\=;#\n': s = s.replace(c, '\\' + c)
+    return s
+
+def keep_spans(segs, dur):
+    out, pos = [], 0.0
+    for s, e in sorted(segs):
+        if s > pos: out.append((pos, s))
+        pos = max(pos, e)
+    if pos < dur: out.append((pos, dur))
+    return [(s, e) for s, e in out if e - s > 0.05]
+
+def remap(chapters, keep):
+    out = []
+    for c in chapters:
+        s = e = 0.0
+        for ks, ke in keep:
+            s += max(0.0, min(c['start_time'], ke) - ks)
+            e += max(0.0, min(c['end_time'], ke) - ks)
+        if e - s > 0.5: out.append(dict(c, start_time=s, end_time=e))
+    return out
+
+class EasyYDL(YoutubeDL):
+    stage = reclaim = None
+
+    def process_info(self, info_dict):
+        if self.reclaim: self.reclaim()
+        return super().process_info(info_dict)
+
+    def post_process(self, filename, info, files_to_move=None):
+        if self.stage: self.stage()
+        return super().post_process(filename, info, files_to_move)
+
+# Runs once formats are chosen: folds the audio transcode and the tags into the
+# merge (or audio extraction) ffmpeg call yt-dlp is about to make anyway.
+class EasyPlanPP(PostProcessor):
+    def __init__(self, downloader, spec):
+        super().__init__(downloader)
+        self.spec = spec
+
+    def run(self, info):
+        fmts = info.get('requested_formats') or []
+        # ranged downloads are muxed by the ffmpeg downloader itself, no merger runs
+        merge = len(fmts) > 1 and self.spec['ext'] in ('mp4', 'mkv') and info.get('section_start') is None
+        audio = next((f.get('acodec') for f in fmts if f.get('acodec') not in (None, 'none')), None)
+        aac = merge and self.spec['aac'] and not is_aac(audio)
+        args = AAC_ARGS[:] if aac else []
+        if self.spec['meta']:
+            for k, v in tags(info).items(): args += ['-metadata', f'{k}={v}']
+        pa = dict(self.get_param('postprocessor_args') or {})
+        pa['merger+ffmpeg_o'] = args if merge else []
+        pa['extractaudio+ffmpeg_o'] = args if self.spec['ext'] in ('mp3', 'wav') else []
+        self._downloader.params['postprocessor_args'] = pa
+        info['__easy_pass'] = {'merge': merge, 'aac': merge and self.spec['aac'], 'tags': self.spec['meta'] and (merge or self.spec['ext'] in ('mp3', 'wav'))}
+        return [], info
+
+# Everything that used to be its own full-file rewrite (SponsorBlock cuts,
+# chapters, thumbnail, tags, AAC for unmerged files) in one ffmpeg pass.
+class EasyFinalizePP(FFmpegPostProcessor):
+    def __init__(self, downloader, spec, report=None):
+        super().__init__(downloader)
+        self.spec = spec
+        self.report = report or (lambda legacy, passes, nbytes: None)
+
+    def _thumb(self, info):
+        return next((t['filepath'] for t in reversed(info.get('thumbnails') or []) if t.get('filepath') and os.path.exists(t['filepath'])), None)
+
+    def _cuts(self, info):
+        segs = [(c['start_time'], c['end_time']) for c in info.get('sponsorblock_chapters') or [] if c.get('category') in self.spec['cuts']]
+        dur = info.get('duration')
+        if not segs or not dur or info.get('section_start') is not None: return None
+        return keep_spans(segs, dur)
+
+    def _ffmeta(self, path, info, chapters):
+        lines = [';FFMETADATA1']
+        if self.spec['meta']: lines += [f'{_esc(k)}={_esc(v)}' for k, v in tags(info).items()]
+        for c in chapters:
+            lines += ['[CHAPTER]', 'TIMEBASE=1/1000', f"START={int(c['start_time'] * 1000)}", f"END={int(c['end_time'] * 1000)}"]
+            if c.get('title'): lines.append(f"title={_esc(c['title'])}")
+        with open(path, 'w', encoding='utf-8') as f: f.write('\n'.join(lines) + '\n')
+
+    @PostProcessor._restrict_to(images=False)
+    def run(self, info):
+        path = info['filepath']
+        ext = path.rsplit('.', 1)[-1].lower()
+        done = info.pop('__easy_pass', None) or {}
+        keep = self._cuts(info) if self.spec['cuts'] else None
+        thumb = self._thumb(info) if self.spec['thumb'] and ext in THUMB_EXTS else None
+        # written but not embeddable in this container (e.g. wav): hand it back so yt-dlp deletes it
+        spare = [p for p in [None if thumb else self._thumb(info)] if p]
+        aac = self.spec['aac'] and ext == 'mp4' and not done.get('aac') and not is_aac(info.get('acodec'))
+        if aac and info.get('acodec') in (None, 'none'): aac = not is_aac(self.get_audio_codec(path))
+        meta = self.spec['meta'] and not done.get('tags')
+        chapters = info.get('chapters') or []
+        if keep: chapters = remap(chapters, keep)
+
+        merged = int(bool(done.get('merge')))
+        legacy = merged + bool(keep) + bool(thumb) + bool(self.spec['meta'])
+        if not (keep or thumb or aac or meta or (chapters and self.spec['meta'])):
+            self.report(legacy, merged, os.path.getsize(path))
+            return spare, info
+
+        tmp = prepend_extension(path, 'temp')
+        spec, ffmeta = f'{tmp}.concat', f'{tmp}.ffmeta'
+        self._ffmeta(ffmeta, info, chapters if (self.spec['meta'] or keep) else [])
+        if keep:
+            with open(spec, 'w', encoding='utf-8') as f:
+                f.writelines(self._concat_spec([path] * len(keep), [{'inpoint': f'{s:.3f}', 'outpoint': f'{e:.3f}'} for s, e in keep]))
+            inputs = [(spec, ['-f', 'concat', '-safe', '0'])]
+        else:
+            inputs = [(path, [])]
+        inputs.append((ffmeta, []))
+
+        out = [*self.stream_copy_opts(ext=ext), '-map_metadata', '1', '-map_chapters', '1']
+        if ext == 'mp3': out = ['-map', '0:a', '-c', 'copy', '-map_metadata', '1', '-id3v2_version', '3']
+        if aac: out += AAC_ARGS
+        if thumb and ext in ('mkv', 'mka'):
+            out += ['-attach', thumb, '-metadata:s:t', 'mimetype=' + MIME.get(thumb.rsplit('.', 1)[-1].lower(), 'image/jpeg')]
+        elif thumb:
+            inputs.append((thumb, []))
+            n = '0' if ext in ('m4a', 'mp3') else '1'
+            out += ['-map', '2', f'-c:v:{n}', 'mjpeg', f'-disposition:v:{n}', 'attached_pic']
+
+        self.to_screen(f'Finalizing "{path}" in one pass')
+        try:
+            self.real_run_ffmpeg(inputs, [(tmp, out)])
+            os.replace(tmp, path)
+        finally:
+            for p in (spec, ffmeta, tmp):
+                if os.path.exists(p): os.remove(p)
+        if keep:
+            info['duration'] = sum(e - s for s, e in keep)
+            info['chapters'] = chapters
+            info['sponsorblock_chapters'] = []
+        self.report(legacy, merged + 1, os.path.getsize(path))
+        return ([thumb] if thumb else spare), info
+
+# Cuts every requested clip out of the span yt-dlp fetched for it. Stream copy
+# by default (the start snaps to the previous keyframe); with "precise" only
+# clips whose start misses a keyframe are re-encoded.
+class EasyClipPP(FFmpegPostProcessor):
+    def __init__(self, downloader, spec):
+        super().__init__(downloader)
+        self.spec = spec
+
+    def _keyframe(self, path, t):
+        if not self.probe_available: return False
+        cmd = [self.probe_executable, '-v', 'error', '-select_streams', 'v:0', '-skip_frame', 'nokey',
+               '-read_intervals', f'{max(t - 5, 0):.3f}%{t + 1:.3f}', '-show_entries', 'frame=pts_time', '-of', 'csv=p=0',
+               self._ffmpeg_filename_argument(path)]
+        out, _, rc = Popen.run(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if rc: return False
+        return any(abs(float(x) - t) < 0.02 for x in out.split() if x.replace('.', '', 1).isdigit())
+
+    @PostProcessor._restrict_to(images=False)
+    def run(self, info):
+        s0, e0 = info.get('section_start'), info.get('section_end')
+        if s0 is None: return [], info
+        span = info['filepath']
+        base, ext = span.rsplit('.span-', 1)[0], os.path.splitext(span)[1]
+        e0 = e0 if e0 is not None else float('inf')
+        clips = [(s, min(e, e0)) for s, e in self.spec['clips'] if s0 - 0.5 <= s < e0]
+        video = info.get('vcodec') != 'none' and ext[1:] not in ('mp3', 'wav', 'm4a', 'opus')
+        out = []
+        for s, e in clips:
+            dst = f"{base} [{hms(s)} - {hms(e)}]{ext}"
+            if len(clips) == 1 and (s, e) == (s0, e0) and not self.spec['precise']:
+                os.replace(span, dst)
+                out.append(dst)
+                continue
+            rs = s - s0
+            exact = video and self.spec['precise'] and not self._keyframe(span, rs)
+            opts = ['-t', f'{e - s:.3f}', '-map_chapters', '-1']
+            if exact: opts += ['-map', '0:V', '-map', '0:a?', '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '18', '-c:a', 'aac', '-b:a', '192k']
+            else: opts += list(self.stream_copy_opts(ext=ext[1:]))
+            self.to_screen(f'{"Re-encoding" if exact else "Copying"} clip {hms(s)}-{hms(e)} into "{dst}"')
+            self.real_run_ffmpeg([(span, ['-ss', f'{rs:.3f}'])], [(dst, opts)])
+            out.append(dst)
+        if not out: return [], info
+        info['clip_files'] = out
+        info['filepath'] = out[-1]
+        return ([span] if os.path.exists(span) else []), info
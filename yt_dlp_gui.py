@@ -1,30 +1,27 @@
 import os
 import sys
-import json
 import threading
 import time
-import sqlite3
+_BOOT = time.perf_counter()
 import re
 import platform
-import psutil
 import urllib.request
+import urllib.parse
+import http.client
+import hashlib
 import subprocess
 import uuid
-import datetime
 import io
-import cv2
 import queue
-from collections import deque
-from pathlib import Path
+import itertools
+from array import array
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import messagebox, filedialog
-from tkinterdnd2 import TkinterDnD, DND_FILES
-import customtkinter as ctk
-from PIL import Image, ImageTk
-import yt_dlp
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from easy_engine import EasyEngine, EasyScheduler, EasyArchive, IMPORT_TIMES, DEFAULTS, lazy, clip_parse, fmt_bytes, fmt_eta
+
+ctk = lazy("customtkinter")
+tkdnd = lazy("tkinterdnd2")
 
 PALETTE = {
     "primary": "#6366f1", "secondary": "#4f46e5", "bg_main": "#020617", 
@@ -35,34 +32,172 @@ PALETTE = {
     "emerald": "#10b981", "indigolight": "#818cf8"
 }
 
-class EasyStorage:
+def thumb_url(e, w=120):
+    ts = sorted((t for t in e.get('thumbnails') or [] if t.get('url')), key=lambda t: t.get('width') or 0)
+    return next((t['url'] for t in ts if (t.get('width') or 0) >= w), ts[-1]['url'] if ts else e.get('thumbnail'))
+
+class EasyPlaylistModel:
     def __init__(self):
-        self.db_path = "ytdlp_easy_gui_core.db"
-        self._init_db()
-
-    def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS downloads (
-                    id TEXT PRIMARY KEY,
-                    title TEXT,
-                    url TEXT,
-                    timestamp DATETIME,
-                    container TEXT,
-                    resolution TEXT,
-                    status TEXT,
-                    file_path TEXT
-                )
-            """)
-            conn.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, val TEXT)")
-
-    def log_transaction(self, t, u, c, r, s, p):
+        self.titles, self.urls, self.keys, self.aids, self.thumbs = [], [], [], [], []
+        self.sel = bytearray()
+        self.view = array('l')
+        self.query = ""
+
+    def __len__(self):
+        return len(self.titles)
+
+    def extend(self, entries):
+        n = len(self.titles)
+        for e in entries:
+            t = e.get('title') or 'ENTRY_NULL'
+            self.titles.append(t)
+            self.urls.append(e.get('url') or e.get('webpage_url'))
+            self.keys.append(t.lower())
+            self.aids.append(EasyArchive.key(e))
+            self.thumbs.append(thumb_url(e))
+        self.sel.extend(b"\x01" * (len(self.titles) - n))
+        self.view.extend(i for i in range(n, len(self.titles)) if self.query in self.keys[i])
+
+    def set_filter(self, q):
+        self.query = q.strip().lower()
+        if not self.query: self.view = array('l', range(len(self.titles)))
+        else: self.view = array('l', (i for i, k in enumerate(self.keys) if self.query in k))
+
+    def set(self, i, v):
+        self.sel[i] = 1 if v else 0
+
+    def select_all(self, v):
+        if not self.query: self.sel = bytearray([1 if v else 0]) * len(self.titles)
+        else:
+            for i in self.view: self.sel[i] = 1 if v else 0
+
+    def select_range(self, a, b, v):
+        if a > b: a, b = b, a
+        for i in self.view[a:b + 1]: self.sel[i] = 1 if v else 0
+
+    def count(self):
+        return self.sel.count(1)
+
+    def selected(self):
+        return [(self.titles[i], self.urls[i], self.aids[i]) for i in range(len(self.titles)) if self.sel[i] and self.urls[i]]
+
+class EasyRing:
+    def __init__(self, n):
+        self.n, self.pos = n, 0
+        self.buf = lazy("numpy").zeros(2 * n)
+
+    def push(self, v):
+        self.buf[self.pos] = self.buf[self.pos + self.n] = v
+        self.pos = (self.pos + 1) % self.n
+
+    def view(self):
+        return self.buf[self.pos:self.pos + self.n]
+
+    def last(self):
+        return self.buf[self.pos + self.n - 1]
+
+class EasyTelemetry:
+    METRICS = ("cpu", "rss", "net_rx", "net_tx", "disk_w", "dl", "cap")
+
+    def __init__(self, hist=120, hz=1.0, speed_fn=None, limit_fn=None):
+        self.hz, self.speed_fn, self.limit_fn = hz, speed_fn, limit_fn
+        self.running, self.gen = False, 0
+        self.resize(hist)
+
+    def resize(self, hist):
+        self.hist = int(hist)
+        self.rings = {k: EasyRing(self.hist) for k in self.METRICS}
+
+    def start(self):
+        if self.running: return
+        self.running = True
+        self.gen += 1
+        threading.Thread(target=self._loop, args=(self.gen,), daemon=True).start()
+
+    def stop(self):
+        self.running = False
+
+    def _loop(self, gen):
+        psutil = lazy("psutil")
+        proc = psutil.Process()
+        psutil.cpu_percent(None)
+        last = None
+        while self.running and gen == self.gen:
+            now, net, disk = time.monotonic(), psutil.net_io_counters(), psutil.disk_io_counters()
+            wr = disk.write_bytes if disk else 0
+            r = self.rings
+            if last:
+                dt = max(now - last[0], 1e-6)
+                r["net_rx"].push((net.bytes_recv - last[1].bytes_recv) / dt)
+                r["net_tx"].push((net.bytes_sent - last[1].bytes_sent) / dt)
+                r["disk_w"].push((wr - last[2]) / dt)
+                r["cpu"].push(psutil.cpu_percent(None))
+                r["rss"].push(proc.memory_info().rss)
+                r["dl"].push(self.speed_fn() if self.speed_fn else 0)
+                r["cap"].push(self.limit_fn() if self.limit_fn else 0)
+            last = (now, net, wr)
+            time.sleep(1 / max(self.hz, 0.1))
+
+class EasyPreview:
+    MAX_W, MAX_H = 960, 540
+
+    def __init__(self, stop, max_fps=30):
+        self.stop, self.max_fps = stop, max_fps
+        self.lock = threading.Lock()
+        self.size = (640, 360)
+        self.bufs, self.pub, self.reading, self.fresh = [None] * 3, None, None, False
+        self.decoded = self.dropped = self.shown = 0
+        self.error = None
+
+    def fit(self, w, h):
+        cw, ch = min(self.size[0], self.MAX_W), min(self.size[1], self.MAX_H)
+        s = min(cw / w, ch / h)
+        return max(2, int(w * s)) & ~1, max(2, int(h * s)) & ~1
+
+    def run(self, url):
+        cv2, np = lazy("cv2"), lazy("numpy")
+        cap = cv2.VideoCapture(url)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("INSERT INTO downloads VALUES (?,?,?,?,?,?,?,?)",
-                             (str(uuid.uuid4()), t, u, datetime.datetime.now(), c, r, s, p))
-        except:
-            pass
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            step = 1 / min(fps if 0 < fps < 240 else 30, self.max_fps)
+            t0, last, small = None, -1.0, None
+            while not self.stop.is_set():
+                # grab() already decodes with the FFmpeg backend; dropping only saves retrieve/resize/convert
+                if not cap.grab(): break
+                self.decoded += 1
+                pts = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+                if t0 is None: t0 = time.monotonic() - pts
+                late = time.monotonic() - (t0 + pts)
+                if late > step or pts - last < step * 0.999:
+                    self.dropped += 1
+                    continue
+                if late < 0 and self.stop.wait(-late): break
+                ok, f = cap.retrieve()
+                if not ok: break
+                last = pts
+                w, h = self.fit(f.shape[1], f.shape[0])
+                if small is None or small.shape[:2] != (h, w): small = np.empty((h, w, 3), np.uint8)
+                cv2.resize(f, (w, h), dst=small, interpolation=cv2.INTER_AREA)
+                with self.lock:
+                    k = next(i for i in range(3) if i != self.pub and i != self.reading)
+                if self.bufs[k] is None or self.bufs[k].shape != small.shape: self.bufs[k] = np.empty_like(small)
+                cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self.bufs[k])
+                with self.lock:
+                    self.pub, self.fresh = k, True
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            cap.release()
+
+    def take(self):
+        with self.lock:
+            if not self.fresh: return None
+            self.fresh, self.reading = False, self.pub
+            return self.bufs[self.pub]
+
+    def release(self):
+        with self.lock:
+            self.reading = None
 
 class EasyFrame(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
@@ -81,12 +216,233 @@ class EasyButton(ctk.CTkButton):
                          hover_color=PALETTE["primary"], text_color=PALETTE["text_p"],
                          corner_radius=10, **kwargs)
 
+class EasyThumbCache:
+    UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) YT-DLP-Easy-GUI"
+
+    def __init__(self, root="ytdlp_easy_gui_thumbs", wrap=None, max_mem=32 * 1024 * 1024, max_disk=128 * 1024 * 1024):
+        self.root, self.wrap = root, wrap or (lambda im: im)
+        self.max_mem, self.max_disk = max_mem, max_disk
+        self.lock = threading.Lock()
+        self.mem, self.mem_bytes = OrderedDict(), 0
+        self.disk_bytes = None
+        self.local = threading.local()
+        self.hits = {'mem': 0, 'disk': 0, 'net': 0, 'fail': 0}
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, u, size):
+        return os.path.join(self.root, hashlib.sha1(f"{size[0]}x{size[1]}|{u}".encode()).hexdigest() + ".jpg")
+
+    def peek(self, u, size):
+        with self.lock:
+            hit = self.mem.get((u, size))
+            if hit: self.mem.move_to_end((u, size))
+            return hit[0] if hit else None
+
+    def get(self, u, size):
+        hit = self.peek(u, size)
+        if hit:
+            with self.lock: self.hits['mem'] += 1
+            return hit
+        Image, p = lazy("PIL.Image"), self._path(u, size)
+        try:
+            im, tier = Image.open(p), 'disk'
+            im.load()
+            os.utime(p)
+        except OSError:
+            try:
+                im, tier = self._decode(self._fetch(u), size), 'net'
+                self._store(p, im)
+            except Exception:
+                with self.lock: self.hits['fail'] += 1
+                return None
+        w = self.wrap(im)
+        with self.lock:
+            self.hits[tier] += 1
+            self.mem[(u, size)] = (w, size[0] * size[1] * 3)
+            self.mem_bytes += size[0] * size[1] * 3
+            while self.mem_bytes > self.max_mem and len(self.mem) > 1: self.mem_bytes -= self.mem.popitem(last=False)[1][1]
+        return w
+
+    def _decode(self, data, size):
+        Image = lazy("PIL.Image")
+        im = Image.open(io.BytesIO(data))
+        im.draft("RGB", size)
+        return im.convert("RGB").resize(size, Image.LANCZOS)
+
+    def _fetch(self, u):
+        pool = self.local.__dict__.setdefault("pool", {})
+        for attempt in range(5):
+            p = urllib.parse.urlsplit(u)
+            key = (p.scheme, p.netloc)
+            conn = pool.get(key)
+            if conn is None:
+                conn = pool[key] = (http.client.HTTPSConnection if p.scheme == "https" else http.client.HTTPConnection)(p.netloc, timeout=10)
+            try:
+                conn.request("GET", (p.path or "/") + (f"?{p.query}" if p.query else ""), headers={"User-Agent": self.UA})
+                r = conn.getresponse()
+                body = r.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                pool.pop(key, None)
+                continue
+            if r.status in (301, 302, 303, 307, 308) and r.getheader("Location"):
+                u = urllib.parse.urljoin(u, r.getheader("Location"))
+                continue
+            if r.status != 200: raise OSError(f"HTTP {r.status}")
+            return body
+        raise OSError("thumbnail fetch failed")
+
+    def _store(self, p, im):
+        try:
+            im.save(p, "JPEG", quality=85)
+            n = os.path.getsize(p)
+        except OSError: return
+        with self.lock:
+            if self.disk_bytes is None: self.disk_bytes = sum(e.stat().st_size for e in os.scandir(self.root) if e.is_file())
+            else: self.disk_bytes += n
+            if self.disk_bytes <= self.max_disk: return
+            files = sorted((e for e in os.scandir(self.root) if e.is_file()), key=lambda e: e.stat().st_mtime)
+            for e in files:
+                if self.disk_bytes <= self.max_disk * 0.8: break
+                try:
+                    self.disk_bytes -= e.stat().st_size
+                    os.remove(e.path)
+                except OSError: pass
+
+    def stats(self):
+        with self.lock:
+            return dict(self.hits, entries=len(self.mem))
+
+# Fetches only what the visible rows asked for last: every want() replaces the
+# pending set, so rows scrolled past never cost a request.
+class EasyThumbLoader:
+    def __init__(self, cache, workers=4):
+        self.cache, self.limit = cache, workers
+        self.cv = threading.Condition()
+        self.pending, self.busy = OrderedDict(), set()
+        self.workers = 0
+
+    def want(self, keys, cb):
+        with self.cv:
+            self.pending = OrderedDict((k, cb) for k in keys if k not in self.busy)
+            while self.workers < min(self.limit, len(self.pending)):
+                self.workers += 1
+                threading.Thread(target=self._worker, daemon=True).start()
+            self.cv.notify_all()
+
+    def _worker(self):
+        while True:
+            with self.cv:
+                while not self.pending: self.cv.wait()
+                k, cb = self.pending.popitem(last=False)
+                self.busy.add(k)
+            try:
+                if self.cache.get(*k) is not None: cb(k)
+            finally:
+                with self.cv: self.busy.discard(k)
+
+class EasyVirtualList(ctk.CTkFrame):
+    ROW_H = 34
+    THUMB = (56, 32)
+
+    def __init__(self, master, model, on_change=None, thumbs=None, loader=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.model, self.on_change = model, on_change
+        self.thumbs, self.loader, self.thumb_job = thumbs, loader, None
+        self.top, self.anchor = 0, None
+        self.rows = []
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
+        self.sb = ctk.CTkScrollbar(self, command=self._on_scroll)
+        self.sb.pack(side="right", fill="y", pady=10)
+        self.body.bind("<Configure>", lambda e: self._layout(e.height))
+        for w in (self, self.body):
+            w.bind("<MouseWheel>", self._on_wheel)
+            w.bind("<Button-4>", lambda e: self.scroll(-3))
+            w.bind("<Button-5>", lambda e: self.scroll(3))
+
+    def _layout(self, h):
+        n = max(1, h // self.ROW_H)
+        while len(self.rows) < n:
+            v = tk.BooleanVar(value=False)
+            cb = ctk.CTkCheckBox(self.body, text="", variable=v, font=("Inter", 12), checkbox_color=PALETTE["primary"], height=self.ROW_H - 6)
+            cb.bind("<Button-1>", lambda e, r=len(self.rows): self._clicked(r, e), add="+")
+            cb.bind("<MouseWheel>", self._on_wheel, add="+")
+            im = ctk.CTkLabel(self.body, text="", width=self.THUMB[0], height=self.THUMB[1], fg_color=PALETTE["bg_main"], corner_radius=4)
+            im.bind("<MouseWheel>", self._on_wheel, add="+")
+            self.rows.append((cb, v, im))
+        x = 15 + (self.THUMB[0] + 10 if self.thumbs else 0)
+        for k, (cb, v, im) in enumerate(self.rows):
+            if k < n:
+                cb.place(x=x, y=k * self.ROW_H, relwidth=0.9)
+                if self.thumbs: im.place(x=15, y=k * self.ROW_H + 1)
+            else: cb.place_forget(); im.place_forget()
+        self.visible = n
+        self.refresh()
+
+    def refresh(self):
+        view = self.model.view
+        n = getattr(self, "visible", 0)
+        self.top = max(0, min(self.top, len(view) - n))
+        want = []
+        for k, (cb, v, im) in enumerate(self.rows[:n]):
+            p = self.top + k
+            u = None
+            if p < len(view):
+                i = view[p]
+                cb.configure(text=self.model.titles[i], state="normal")
+                v.set(bool(self.model.sel[i]))
+                u = self.model.thumbs[i]
+            else:
+                cb.configure(text="", state="disabled")
+                v.set(False)
+            if self.thumbs:
+                img = self.thumbs.peek(u, self.THUMB) if u else None
+                im.configure(image=img)
+                if u and img is None: want.append((u, self.THUMB))
+        if self.loader: self.loader.want(want, self._thumb_ready)
+        total = max(len(view), 1)
+        self.sb.set(self.top / total, min(1.0, (self.top + n) / total))
+
+    def _thumb_ready(self, k):
+        if self.thumb_job is None: self.thumb_job = self.after(50, self._thumb_flush)
+
+    def _thumb_flush(self):
+        self.thumb_job = None
+        self.refresh()
+
+    def scroll(self, d):
+        self.top += d
+        self.refresh()
+
+    def _on_wheel(self, e):
+        self.scroll(-3 if e.delta > 0 else 3)
+
+    def _on_scroll(self, *a):
+        if a[0] == "moveto": self.top = int(float(a[1]) * len(self.model.view))
+        elif a[0] == "scroll": self.top += int(a[1]) * (getattr(self, "visible", 1) if a[2] == "pages" else 1)
+        self.refresh()
+
+    def _clicked(self, r, e):
+        p = self.top + r
+        if p >= len(self.model.view): return
+        v = self.rows[r][1].get()
+        if e.state & 0x1 and self.anchor is not None:
+            self.model.select_range(self.anchor, p, v)
+            self.refresh()
+        else: self.model.set(self.model.view[p], v)
+        self.anchor = p
+        if self.on_change: self.on_change()
+
 class YTDLPEasyGUI(ctk.CTk):
+    LOG_PAGE = 25
+    STAGES = {"queued": "QUEUE", "running": "DL", "waiting": "PP-WAIT", "processing": "PP", "skipped": "SKIP"}
+
     def __init__(self):
         super().__init__()
         
         try:
-            self.tkdnd = TkinterDnD._require(self)
+            self.tkdnd = tkdnd.TkinterDnD._require(self)
         except:
             pass
             
@@ -95,32 +451,59 @@ class YTDLPEasyGUI(ctk.CTk):
         self.configure(fg_color=PALETTE["bg_main"])
         
         self.bus = queue.Queue()
-        self.db = EasyStorage()
+        self.ui_updates, self.ui_rate, self.ui_tick = 0, 0.0, time.monotonic()
         self.tabs = {}
         self.nav_elements = {}
         self.task_registry = {}
         self.kill_preview = threading.Event()
+        self.preview = None
         
         self.vars = {
             "url": tk.StringVar(),
-            "target_id": tk.StringVar(),
-            "target_res": tk.StringVar(),
-            "ext": tk.StringVar(value="mp4"),
-            "path": tk.StringVar(value=str(Path.home() / "Downloads")),
-            "t_start": tk.StringVar(value="00:00:00"),
-            "t_end": tk.StringVar(value="00:00:10"),
-            "opt_sponsor": tk.BooleanVar(value=True),
-            "opt_aac": tk.BooleanVar(value=True),
-            "opt_thumb": tk.BooleanVar(value=True),
-            "opt_gpu": tk.BooleanVar(value=True),
-            "opt_subs": tk.BooleanVar(value=False)
+            "target_id": tk.StringVar(value=DEFAULTS["target_id"]),
+            "target_res": tk.StringVar(value=DEFAULTS["target_res"]),
+            "ext": tk.StringVar(value=DEFAULTS["ext"]),
+            "path": tk.StringVar(value=DEFAULTS["path"]),
+            "t_start": tk.StringVar(value=DEFAULTS["t_start"]),
+            "t_end": tk.StringVar(value=DEFAULTS["t_end"]),
+            "opt_sponsor": tk.BooleanVar(value=DEFAULTS["opt_sponsor"]),
+            "opt_aac": tk.BooleanVar(value=DEFAULTS["opt_aac"]),
+            "opt_thumb": tk.BooleanVar(value=DEFAULTS["opt_thumb"]),
+            "opt_gpu": tk.BooleanVar(value=DEFAULTS["opt_gpu"]),
+            "opt_subs": tk.BooleanVar(value=DEFAULTS["opt_subs"]),
+            "opt_precise": tk.BooleanVar(value=DEFAULTS["opt_precise"]),
+            "max_workers": tk.IntVar(value=3),
+            "host_limit": tk.IntVar(value=2),
+            "post_workers": tk.IntVar(value=os.cpu_count() or 2),
+            "bw_rate": tk.StringVar(value=""),
+            "bw_sched": tk.StringVar(value=""),
+            "max_frag": tk.IntVar(value=8),
+            "tel_hz": tk.IntVar(value=1),
+            "tel_hist": tk.IntVar(value=120),
+            "prev_fps": tk.IntVar(value=30)
         }
+        self.engine = EasyEngine(workers=self.vars["max_workers"].get(), host_limit=self.vars["host_limit"].get(), on_event=self.bus.put, post_workers=self.vars["post_workers"].get())
+        self.db, self.meta, self.progress, self.sched = self.engine.db, self.engine.meta, self.engine.progress, self.engine.sched
+        self.thumbs = EasyThumbCache(wrap=lambda im: ctk.CTkImage(im, size=im.size))
+        self.thumb_loader = EasyThumbLoader(self.thumbs)
+        for k in ("max_workers", "host_limit", "post_workers"):
+            self.vars[k].trace_add("write", lambda *_: self.sched.configure(self.vars["max_workers"].get(), self.vars["host_limit"].get(), self.vars["post_workers"].get()))
         
-        self.telemetry_cpu = deque([0]*100, maxlen=100)
+        for k in ("bw_rate", "bw_sched", "max_frag"):
+            self.vars[k].trace_add("write", lambda *_: self.engine.bw.configure(self.vars["bw_rate"].get(), self.vars["bw_sched"].get(), self.vars["max_frag"].get()))
+        for k in ("tel_hz", "tel_hist"):
+            self.vars[k].trace_add("write", lambda *_: self._tel_config())
+        self.current_tab = None
+        self.tel_job = None
+        self.t_paint = None
+        self.bind("<Map>", self._first_paint, add="+")
         self.cache_media = None
-        self.cache_playlist = []
+        self.pl_model = EasyPlaylistModel()
+        self.scan_gen = 0
 
+        self.protocol("WM_DELETE_WINDOW", self._shutdown)
         self._build_scaffold()
+        self._rehydrate()
         self._ignite_daemons()
 
     def _build_scaffold(self):
@@ -144,17 +527,21 @@ class YTDLPEasyGUI(ctk.CTk):
         self.screen = ctk.CTkFrame(self, fg_color="transparent")
         self.screen.pack(side="right", fill="both", expand=True, padx=40, pady=40)
 
-        self._ui_dashboard()
-        self._ui_playlist()
-        self._ui_surgeon()
-        self._ui_monitor()
-        self._ui_queue()
-        self._ui_logs()
-        self._ui_telemetry()
-        self._ui_config()
-        
+        self._tab_builders = {
+            "Dashboard": self._ui_dashboard, "Playlist Engine": self._ui_playlist, "Clip Surgeon": self._ui_surgeon,
+            "Live Monitor": self._ui_monitor, "Execution Queue": self._ui_queue, "Log History": self._ui_logs,
+            "System Telemetry": self._ui_telemetry, "Global Config": self._ui_config
+        }
         self.navigate("Dashboard")
 
+    def _shutdown(self):
+        self.engine.close()
+        self.destroy()
+
+    def _tab(self, n):
+        if n not in self.tabs: self._tab_builders[n]()
+        return self.tabs[n]
+
     def _ui_dashboard(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["Dashboard"] = p
@@ -197,10 +584,10 @@ class YTDLPEasyGUI(ctk.CTk):
     def _ui_surgeon(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["Clip Surgeon"] = p
-        w = EasyFrame(p); w.pack(expand=True, fill="both", padx=80, pady=80)
-        ctk.CTkLabel(w, text="TEMPORAL CLIP EXTRACTION", font=("Inter", 32, "bold")).pack(pady=(60,15))
-        ctk.CTkLabel(w, text="Nondestructive extraction using stream-copy architecture.", text_color=PALETTE["text_s"]).pack(pady=(0,50))
-        rs = ctk.CTkFrame(w, fg_color="transparent"); rs.pack(pady=25)
+        w = EasyFrame(p); w.pack(expand=True, fill="both", padx=80, pady=40)
+        ctk.CTkLabel(w, text="TEMPORAL CLIP EXTRACTION", font=("Inter", 32, "bold")).pack(pady=(40,15))
+        ctk.CTkLabel(w, text="Nondestructive extraction using stream-copy architecture. One fetch per source, N clips.", text_color=PALETTE["text_s"]).pack(pady=(0,20))
+        rs = ctk.CTkFrame(w, fg_color="transparent"); rs.pack(pady=15)
         st = {"font": ("JetBrains Mono", 28), "width": 240, "height": 70, "justify": "center", "fg_color": PALETTE["bg_main"], "border_color": PALETTE["bg_border"]}
         ls = ctk.CTkFrame(rs, fg_color="transparent"); ls.pack(side="left", padx=50)
         ctk.CTkLabel(ls, text="VECTOR START (HH:MM:SS)", font=("Inter", 11, "bold")).pack(pady=10)
@@ -208,12 +595,32 @@ class YTDLPEasyGUI(ctk.CTk):
         rx = ctk.CTkFrame(rs, fg_color="transparent"); rx.pack(side="left", padx=50)
         ctk.CTkLabel(rx, text="VECTOR END (HH:MM:SS)", font=("Inter", 11, "bold")).pack(pady=10)
         ctk.CTkEntry(rx, textvariable=self.vars["t_end"], **st).pack()
-        EasyButton(w, text="INJECT EXTRACTION TASK", fg_color=PALETTE["warning"], width=450, height=80, command=self.op_download_clip).pack(pady=60)
+        cr = ctk.CTkFrame(w, fg_color="transparent"); cr.pack(pady=10)
+        EasyButton(cr, text="＋ ADD TO CLIP LIST", width=220, height=40, command=self._clip_add).pack(side="left", padx=15)
+        ctk.CTkCheckBox(cr, text="Frame-accurate (re-encode starts that miss a keyframe)", variable=self.vars["opt_precise"], checkbox_color=PALETTE["primary"]).pack(side="left", padx=15)
+        self.clip_box = ctk.CTkTextbox(w, width=520, height=150, font=("JetBrains Mono", 13), fg_color=PALETTE["bg_main"], border_color=PALETTE["bg_border"], border_width=1)
+        self.clip_box.pack(pady=10)
+        EasyButton(w, text="INJECT EXTRACTION TASK", fg_color=PALETTE["warning"], width=450, height=80, command=self.op_download_clip).pack(pady=(20, 40))
+
+    def _clip_add(self):
+        self.clip_box.insert("end", f"{self.vars['t_start'].get()} - {self.vars['t_end'].get()}\n")
+
+    def _clips(self):
+        clips = [c for c in map(clip_parse, self.clip_box.get("1.0", "end").splitlines()) if c]
+        return clips or [c for c in [clip_parse(f"{self.vars['t_start'].get()}-{self.vars['t_end'].get()}")] if c]
 
     def _ui_playlist(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["Playlist Engine"] = p
-        self.pl_list = ctk.CTkScrollableFrame(p, fg_color=PALETTE["bg_card"], border_width=1, border_color=PALETTE["bg_border"])
+        bar = ctk.CTkFrame(p, fg_color="transparent"); bar.pack(fill="x", pady=(0, 15))
+        self.pl_filter = tk.StringVar()
+        ctk.CTkEntry(bar, textvariable=self.pl_filter, placeholder_text="Filter entries...", height=40, fg_color=PALETTE["bg_main"], border_color=PALETTE["bg_border"]).pack(side="left", fill="x", expand=True)
+        self.pl_filter.trace_add("write", lambda *_: self._pl_apply(lambda: self.pl_model.set_filter(self.pl_filter.get())))
+        EasyButton(bar, text="NONE", width=90, height=40, command=lambda: self._pl_apply(lambda: self.pl_model.select_all(False))).pack(side="right", padx=(10, 0))
+        EasyButton(bar, text="ALL", width=90, height=40, command=lambda: self._pl_apply(lambda: self.pl_model.select_all(True))).pack(side="right", padx=(10, 0))
+        self.pl_meta = ctk.CTkLabel(bar, text="", font=("JetBrains Mono", 12), text_color=PALETTE["text_s"])
+        self.pl_meta.pack(side="right", padx=20)
+        self.pl_list = EasyVirtualList(p, self.pl_model, on_change=self._pl_count, thumbs=self.thumbs, loader=self.thumb_loader, fg_color=PALETTE["bg_card"], border_width=1, border_color=PALETTE["bg_border"])
         self.pl_list.pack(fill="both", expand=True, pady=(0,25))
         EasyButton(p, text="QUEUE ALL VALIDATED ENTRIES", height=70, fg_color=PALETTE["primary"], command=self.op_bulk).pack(fill="x")
 
@@ -222,28 +629,100 @@ class YTDLPEasyGUI(ctk.CTk):
         self.tabs["Live Monitor"] = p
         self.mon_canv = tk.Canvas(p, bg="#000", highlightthickness=0)
         self.mon_canv.pack(fill="both", expand=True, padx=15, pady=15)
+        self.mon_canv.bind("<Configure>", lambda e: self.preview and setattr(self.preview, "size", (e.width, e.height)))
+        self.mon_img = self.mon_canv.create_image(0, 0, anchor="center")
+        self.mon_stats = self.mon_canv.create_text(12, 12, anchor="nw", fill=PALETTE["accent"], font=("JetBrains Mono", 11))
+        self.mon_photo = None
         EasyButton(p, text="ACTIVATE STREAM INTERCEPT", width=300, command=self.op_preview).pack(pady=15)
 
     def _ui_queue(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["Execution Queue"] = p
+        self.q_meta = ctk.CTkLabel(p, text="", font=("JetBrains Mono", 12), text_color=PALETTE["text_s"])
+        self.q_meta.pack(anchor="w", padx=20, pady=(0, 10))
         self.q_scroll = ctk.CTkScrollableFrame(p, fg_color="transparent")
         self.q_scroll.pack(fill="both", expand=True)
 
     def _ui_logs(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["Log History"] = p
-        self.log_scroll = ctk.CTkScrollableFrame(p, fg_color="transparent")
+        bar = ctk.CTkFrame(p, fg_color="transparent"); bar.pack(fill="x", pady=(0, 15))
+        self.log_q = tk.StringVar()
+        ctk.CTkEntry(bar, textvariable=self.log_q, placeholder_text="Search titles...", height=40, fg_color=PALETTE["bg_main"], border_color=PALETTE["bg_border"]).pack(side="left", fill="x", expand=True)
+        self.log_q.trace_add("write", lambda *_: self._log_search())
+        EasyButton(bar, text="NEXT ▶", width=100, height=40, command=lambda: self._log_page(1)).pack(side="right", padx=(10, 0))
+        EasyButton(bar, text="◀ PREV", width=100, height=40, command=lambda: self._log_page(-1)).pack(side="right", padx=(10, 0))
+        self.log_meta = ctk.CTkLabel(bar, text="", font=("JetBrains Mono", 12), text_color=PALETTE["text_s"])
+        self.log_meta.pack(side="right", padx=20)
+        self.log_scroll = EasyFrame(p)
         self.log_scroll.pack(fill="both", expand=True)
+        self.log_rows = []
+        for _ in range(self.LOG_PAGE):
+            r = ctk.CTkFrame(self.log_scroll, fg_color="transparent", height=30); r.pack(fill="x", padx=20, pady=1); r.pack_propagate(False)
+            cells = [ctk.CTkLabel(r, text="", font=("JetBrains Mono", 11), anchor="w", width=w) for w in (170, 80, 90)]
+            for c in cells: c.pack(side="left")
+            cells.append(ctk.CTkLabel(r, text="", font=("Inter", 12), anchor="w")); cells[-1].pack(side="left", fill="x", expand=True)
+            self.log_rows.append(cells)
+        self.log_cursors, self.log_job = [None], None
+        self._log_load()
+
+    def _log_search(self):
+        if self.log_job: self.after_cancel(self.log_job)
+        self.log_job = self.after(250, lambda: (setattr(self, "log_cursors", [None]), self._log_load()))
+
+    def _log_page(self, d):
+        if d > 0 and self.log_last and len(self.log_page_rows) == self.LOG_PAGE: self.log_cursors.append(self.log_last)
+        elif d < 0 and len(self.log_cursors) > 1: self.log_cursors.pop()
+        else: return
+        self._log_load()
+
+    def _log_load(self):
+        self.log_job = None
+        q = self.log_q.get()
+        rows = self.log_page_rows = self.db.history(q, self.log_cursors[-1], self.LOG_PAGE)
+        self.log_last = (rows[-1][3], rows[-1][0]) if rows else None
+        for cells, row in itertools.zip_longest(self.log_rows, rows):
+            if row:
+                _, t, u, ts, c, r, s, path = row
+                vals = (str(ts)[:19], s or "", f"{c or ''} {r + 'P' if r else ''}", t or u)
+                cells[1].configure(text_color=PALETTE["emerald"] if s == "SUCCESS" else PALETTE["danger"])
+            else: vals = ("", "", "", "")
+            for cell, v in zip(cells, vals): cell.configure(text=v)
+        self.log_meta.configure(text=f"PAGE {len(self.log_cursors)} | {self.db.history_count(q)} ROWS")
 
     def _ui_telemetry(self):
         p = ctk.CTkFrame(self.screen, fg_color="transparent")
         self.tabs["System Telemetry"] = p
+        Figure = lazy("matplotlib.figure").Figure
+        FigureCanvasTkAgg = lazy("matplotlib.backends.backend_tkagg").FigureCanvasTkAgg
+        self.telemetry = EasyTelemetry(self.vars["tel_hist"].get(), self.vars["tel_hz"].get(), speed_fn=self.progress.aggregate, limit_fn=self.engine.bw.limit)
+        self.tel_meta = ctk.CTkLabel(p, text="", font=("JetBrains Mono", 12), text_color=PALETTE["text_s"])
+        self.tel_meta.pack(anchor="w", padx=20, pady=(0, 10))
         self.tel_fig = Figure(figsize=(12, 6), facecolor=PALETTE["bg_card"])
-        self.tel_ax = self.tel_fig.add_subplot(111)
-        self.tel_ax.set_facecolor(PALETTE["bg_card"])
+        spec = [("CPU %", [("cpu", PALETTE["primary"], 1)]),
+                ("RSS MiB", [("rss", PALETTE["purple"], 1 / 2**20)]),
+                ("MiB/s", [("net_rx", PALETTE["cyan"], 1 / 2**20), ("net_tx", PALETTE["amber"], 1 / 2**20),
+                           ("disk_w", PALETTE["rose"], 1 / 2**20), ("dl", PALETTE["emerald"], 1 / 2**20), ("cap", PALETTE["text_s"], 1 / 2**20)])]
+        self.tel_axes, self.tel_lines = [], []
+        for k, (title, series) in enumerate(spec):
+            ax = self.tel_fig.add_subplot(len(spec), 1, k + 1)
+            ax.set_facecolor(PALETTE["bg_card"])
+            ax.tick_params(colors=PALETTE["text_s"], labelsize=8)
+            ax.set_ylabel(title, color=PALETTE["text_s"], fontsize=9)
+            ax.set_ylim(0, 100 if k == 0 else 1)
+            lines = []
+            for name, col, scale in series:
+                ln, = ax.plot([], [], color=col, linewidth=1.5, label=name, animated=True, linestyle="--" if name == "cap" else "-")
+                lines.append((ln, name, scale))
+            if len(series) > 1: ax.legend(loc="upper left", fontsize=8, facecolor=PALETTE["bg_card"], labelcolor=PALETTE["text_s"])
+            self.tel_axes.append((ax, k != 0))
+            self.tel_lines.append(lines)
+        self.tel_fig.tight_layout()
         self.tel_canv = FigureCanvasTkAgg(self.tel_fig, master=p)
         self.tel_canv.get_tk_widget().pack(fill="both", expand=True)
+        self.tel_bg = None
+        self.tel_canv.mpl_connect("draw_event", lambda e: setattr(self, "tel_bg", self.tel_canv.copy_from_bbox(self.tel_fig.bbox)))
+        self._tel_resize()
 
     def _ui_config(self):
         p = ctk.CTkScrollableFrame(self.screen, fg_color="transparent")
@@ -257,39 +736,138 @@ class YTDLPEasyGUI(ctk.CTk):
         row("SponsorBlock API Deep Packet Inspection", self.vars["opt_sponsor"])
         row("Atomic Metadata & Thumbnail Injection", self.vars["opt_thumb"])
         row("Sub-orbital Auto-Subtitle Fetching", self.vars["opt_subs"])
+        def num(txt, v, lo, hi):
+            f = EasyFrame(p); f.pack(fill="x", pady=6)
+            ctk.CTkLabel(f, text=txt, font=("Inter", 14)).pack(side="left", padx=30, pady=25)
+            ctk.CTkLabel(f, textvariable=v, font=("JetBrains Mono", 14), width=40).pack(side="right", padx=(0, 30))
+            ctk.CTkSlider(f, from_=lo, to=hi, number_of_steps=hi-lo, variable=v, progress_color=PALETTE["primary"]).pack(side="right", padx=15)
+        num("Concurrent Download Workers", self.vars["max_workers"], 1, 16)
+        num("Concurrent Downloads Per Host", self.vars["host_limit"], 1, 8)
+        num("Concurrent Post-Processing Jobs", self.vars["post_workers"], 1, max(4, (os.cpu_count() or 2) * 2))
+        num("Telemetry Sample Rate (Hz)", self.vars["tel_hz"], 1, 10)
+        num("Telemetry History (samples)", self.vars["tel_hist"], 30, 600)
+        num("Live Monitor Frame Cap (fps)", self.vars["prev_fps"], 5, 60)
+        num("Max Fragment Parallelism (adaptive)", self.vars["max_frag"], 1, 16)
+        def text(txt, v, hint, w=260):
+            f = EasyFrame(p); f.pack(fill="x", pady=6)
+            ctk.CTkLabel(f, text=txt, font=("Inter", 14)).pack(side="left", padx=30, pady=25)
+            ctk.CTkEntry(f, textvariable=v, placeholder_text=hint, width=w, font=("JetBrains Mono", 13), fg_color=PALETTE["bg_main"], border_color=PALETTE["bg_border"]).pack(side="right", padx=30)
+        text("Global Bandwidth Budget (shared by all workers)", self.vars["bw_rate"], "unlimited (e.g. 4M, 800K)")
+        text("Bandwidth Schedule (overrides budget)", self.vars["bw_sched"], "01:00-07:00=0, 09:00-18:00=1M", 380)
 
     def _ignite_daemons(self):
-        threading.Thread(target=self._tel_loop, daemon=True).start()
         self._signal_processor()
+        self._queue_metrics()
 
     def _signal_processor(self):
+        n = 0
+        for tid, st in self.progress.drain().items():
+            m = self.task_registry.get(tid)
+            if not m: continue
+            m['pb'].set(st['v'])
+            m['tx'].configure(text=f"{st['v'] * 100:.1f}% | {fmt_bytes(st['s'])}/s | ETA: {fmt_eta(st['e'])}")
+            n += 1
         while not self.bus.empty():
             sig = self.bus.get()
             tid = sig['id']
             if tid in self.task_registry:
                 m = self.task_registry[tid]
-                if sig['type'] == 'p':
-                    m['pb'].set(sig['v'] / 100)
-                    m['tx'].configure(text=f"{sig['v']}% | {sig['s']} | ETA: {sig['e']}")
+                n += 1
+                if sig['type'] == 's':
+                    m['sg'].configure(text=self.STAGES.get(sig['v'], ""))
+                    if sig['v'] in ('queued', 'running', 'waiting', 'processing', 'paused', 'cancelled', 'skipped'):
+                        txt = {"queued": "QUEUED", "running": "HANDSHAKING...", "waiting": "AWAITING FFMPEG SLOT", "processing": "POST-PROCESSING...", "paused": "PAUSED", "cancelled": "CANCELLED", "skipped": "SKIPPED (ALREADY ARCHIVED)"}[sig['v']]
+                        m['tx'].configure(text=f"STATUS: {txt}" if sig['v'] != 'running' else txt, text_color=PALETTE["text_s"] if sig['v'] in ('cancelled', 'skipped') else PALETTE["text_p"])
+                    if sig['v'] == 'skipped': m['pb'].set(1.0)
+                    if sig['v'] == 'waiting': m['pb'].set(1.0)
+                    if sig['v'] == 'failed': m['tx'].configure(text="STATUS: FATAL_ERROR", text_color=PALETTE["danger"])
+                    m['bp'].configure(text="▶" if sig['v'] in ('paused', 'failed') else "⏸")
+                elif sig['type'] == 't':
+                    m['tm'] = sig['v']
                 elif sig['type'] == 'f':
-                    m['tx'].configure(text="STATUS: COMPLETE", text_color=PALETTE["emerald"])
+                    tm = m.get('tm')
+                    m['tx'].configure(text="STATUS: COMPLETE" + (f" | SETUP {tm['setup']:.1f}s · DL {tm['transfer']:.1f}s · POST {tm['post']:.1f}s" if tm else ""), text_color=PALETTE["emerald"])
                     m['pb'].set(1.0)
                 elif sig['type'] == 'e':
                     m['tx'].configure(text="STATUS: FATAL_ERROR", text_color=PALETTE["danger"])
-        self.after(50, self._signal_processor)
+        self.ui_updates += n
+        now = time.monotonic()
+        if now - self.ui_tick >= 1:
+            self.ui_rate, self.ui_updates, self.ui_tick = self.ui_updates / (now - self.ui_tick), 0, now
+        self.after(33, self._signal_processor)
 
-    def _tel_loop(self):
-        while True:
-            self.telemetry_cpu.append(psutil.cpu_percent())
-            self.tel_ax.clear()
-            self.tel_ax.plot(list(self.telemetry_cpu), color=PALETTE["primary"], linewidth=2)
-            self.tel_ax.fill_between(range(len(self.telemetry_cpu)), list(self.telemetry_cpu), color=PALETTE["primary"], alpha=0.1)
-            try: self.tel_canv.draw()
-            except: pass
-            time.sleep(1)
+    def _queue_metrics(self):
+        self.after(500, self._queue_metrics)
+        if self.current_tab != "Execution Queue": return
+        s, a, io = self.sched.stats(), self.engine.archive.stats(), self.engine.io.stats()
+        lanes = " | ".join(f"{'SINGLE' if k == EasyScheduler.PRIO_SINGLE else 'BULK'} {v}" for k, v in sorted(s['lanes'].items()))
+        self.q_meta.configure(text=f"RUNNING {s['running']}/{self.sched.limit} | POST {s['processing']}/{self.sched.post_limit} (+{s['waiting']} waiting) | QUEUED {s['queued']} | PAUSED {s['paused']} | DONE {s['done']} | FAILED {s['failed']} | CANCELLED {s['cancelled']} | SKIPPED {a['skipped']} ({fmt_bytes(a['saved'])} saved) | PP {io['passes']}/{io['legacy_passes']} passes ({fmt_bytes(io['saved'])} I/O saved) | UI {self.ui_rate:.0f} upd/s" + (f" || {lanes}" if lanes else ""))
+
+    def _first_paint(self, e):
+        if self.t_paint is not None: return
+        self.update_idletasks()
+        self.t_paint = time.perf_counter() - _BOOT
+        self.event_generate("<<FirstPaint>>", when="tail")
+        threading.Thread(target=lazy, args=("yt_dlp",), daemon=True).start()
+
+    def _tel_config(self):
+        if "System Telemetry" not in self.tabs: return
+        self.telemetry.hz = self.vars["tel_hz"].get()
+        self._tel_resize()
+
+    def _tel_resize(self):
+        h = max(30, self.vars["tel_hist"].get())
+        if h != self.telemetry.hist: self.telemetry.resize(h)
+        np = lazy("numpy")
+        x = np.arange(h)
+        for lines in self.tel_lines:
+            for ln, _, _ in lines: ln.set_data(x, np.zeros(h))
+        for ax, _ in self.tel_axes: ax.set_xlim(0, h - 1)
+        self.tel_canv.draw_idle()
+
+    def _tel_render(self):
+        if self.current_tab != "System Telemetry":
+            self.tel_job = None
+            return
+        self.tel_job = self.after(int(1000 / max(self.telemetry.hz, 1)), self._tel_render)
+        rings, redraw = self.telemetry.rings, self.tel_bg is None
+        for (ax, auto), lines in zip(self.tel_axes, self.tel_lines):
+            peak = 0.0
+            for ln, name, scale in lines:
+                y = rings[name].view() * scale
+                if len(y) != len(ln.get_xdata()): return self._tel_resize()
+                ln.set_ydata(y)
+                peak = max(peak, float(y.max()))
+            lo, hi = ax.get_ylim()
+            if auto and (peak > hi or (hi > 1 and peak < hi * 0.25)):
+                ax.set_ylim(0, max(peak * 1.5, 1))
+                redraw = True
+        c, bw, th, ps = self.meta.stats(), self.engine.bw.stats(), self.thumbs.stats(), self.engine.pool.stats()
+        n = c['hits'] + c['misses']
+        top = sorted(self.progress.rates().items(), key=lambda kv: -kv[1])[:3]
+        per = " | ".join(f"{self.sched.tasks[k]['args'][1][:18]} {fmt_bytes(v)}/s" for k, v in top if k in self.sched.tasks)
+        self.tel_meta.configure(text=f"CPU {rings['cpu'].last():.0f}% | RSS {fmt_bytes(rings['rss'].last())} | DL {fmt_bytes(rings['dl'].last())}/s"
+                                     f" / {fmt_bytes(bw['limit']) + '/s' if bw['limit'] else 'UNLIMITED'} | THROTTLED {bw['throttled']:.0f}s" + (f" [{per}]" if per else "") + " || "
+                                     f"META CACHE | HITS {c['hits']} | MISSES {c['misses']} | HIT RATE {c['hits'] / n * 100 if n else 0:.0f}% | ENTRIES {c['entries']} || "
+                                     f"THUMBS | MEM {th['mem']} | DISK {th['disk']} | NET {th['net']} || "
+                                     f"SESSIONS | NEW {ps['created']} | REUSED {ps['reused']} | IDLE {ps['idle']} || UI {self.ui_rate:.0f} upd/s")
+        if redraw:
+            self.tel_canv.draw()
+        else:
+            self.tel_canv.restore_region(self.tel_bg)
+        for (ax, _), lines in zip(self.tel_axes, self.tel_lines):
+            for ln, _, _ in lines: ax.draw_artist(ln)
+        self.tel_canv.blit(self.tel_fig.bbox)
 
     def navigate(self, n):
+        self.current_tab = n
+        self._tab(n)
         if n != "Live Monitor": self.kill_preview.set()
+        if n == "Log History": self._log_load()
+        if n == "System Telemetry":
+            self.telemetry.start()
+            if not self.tel_job: self._tel_render()
+        elif "System Telemetry" in self.tabs: self.telemetry.stop()
         for k, v in self.tabs.items():
             if k == n: v.pack(fill="both", expand=True)
             else: v.pack_forget()
@@ -303,12 +881,21 @@ class YTDLPEasyGUI(ctk.CTk):
         threading.Thread(target=self._scan_kernel, args=(u,), daemon=True).start()
 
     def _scan_kernel(self, u):
+        self.scan_gen += 1
+        gen, streamed = self.scan_gen, []
+        def feed(batch, done):
+            if not streamed:
+                streamed.append(True)
+                self.after(0, lambda: self._render_playlist({'entries': []}, streaming=True))
+            self.after(0, lambda b=batch: self._pl_append(b, gen, done=done))
         try:
-            with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': 'in_playlist'}) as ydl:
-                meta = ydl.extract_info(u, download=False)
-                if 'entries' in meta: self.after(0, lambda: self._render_playlist(meta))
-                else: self.after(0, lambda: self._render_single(meta))
-        except Exception as e: self.after(0, lambda: messagebox.showerror("IO_ERROR", str(e)))
+            meta = self.engine.scan(u, on_entries=feed, alive=lambda: gen == self.scan_gen)
+            if meta is None or streamed: return
+            if 'entries' in meta: self.after(0, lambda: self._render_playlist(meta))
+            else: self.after(0, lambda: self._render_single(meta))
+        except Exception as e:
+            err = str(e)
+            self.after(0, lambda: messagebox.showerror("IO_ERROR", err))
 
     def _render_single(self, m):
         self.cache_media = m
@@ -328,145 +915,138 @@ class YTDLPEasyGUI(ctk.CTk):
 
     def _get_thumb(self, u):
         try:
-            r = urllib.request.urlopen(u).read()
-            i = Image.open(io.BytesIO(r)).resize((390, 220), Image.LANCZOS)
-            p = ctk.CTkImage(i, size=(390, 220))
-            self.after(0, lambda: self.viz_preview.configure(image=p, text=""))
+            p = self.thumbs.get(u, (390, 220))
+            if p: self.after(0, lambda: self.viz_preview.configure(image=p, text=""))
         except: pass
 
     def op_download_full(self):
         self.navigate("Execution Queue")
-        self._spawn_worker(self.cache_media['title'], self.cache_media['webpage_url'])
+        self._spawn_worker(self.cache_media['title'], self.cache_media['webpage_url'], prio=EasyScheduler.PRIO_SINGLE, aid=EasyArchive.key(self.cache_media))
 
     def op_download_clip(self):
         if not self.cache_media: return
+        cfg = self._snapshot(surgical=True)
+        n = len(cfg['clips'])
+        if not n: return messagebox.showerror("CLIP_RANGE", "No valid clip range: END must be after START.")
         self.navigate("Execution Queue")
-        self._spawn_worker(f"{self.cache_media['title']}_SURGERY", self.cache_media['webpage_url'], surgical=True)
+        self._spawn_worker(f"{self.cache_media['title']}_SURGERY" + (f" x{n}" if n > 1 else ""), self.cache_media['webpage_url'], prio=EasyScheduler.PRIO_SINGLE, cfg=cfg)
+
+    def _snapshot(self, surgical=False):
+        cfg = {k: v.get() for k, v in self.vars.items() if k not in ("url", "max_workers", "host_limit", "post_workers", "bw_rate", "bw_sched", "max_frag", "tel_hz", "tel_hist", "prev_fps")}
+        if surgical: cfg['clips'] = self._clips()
+        return cfg
 
-    def _spawn_worker(self, t, u, surgical=False):
-        tid = str(uuid.uuid4())
+    def _spawn_worker(self, t, u, surgical=False, prio=EasyScheduler.PRIO_BULK, cfg=None, tid=None, state='queued', aid=None, quiet=False):
+        tid = tid or str(uuid.uuid4())
+        cfg = cfg or self._snapshot(surgical)
+        if not self.engine.submit(t, u, cfg, prio=prio, tid=tid, state=state, aid=aid):
+            if not quiet: self._skip_card(t[:65])
+            return False
+        self._tab("Execution Queue")
         c = EasyFrame(self.q_scroll, height=110); c.pack(fill="x", pady=6, padx=20); c.pack_propagate(False)
         ctk.CTkLabel(c, text=t[:65], font=("Inter", 13, "bold")).pack(side="left", padx=30)
+        g = ctk.CTkLabel(c, text="", width=70, font=("JetBrains Mono", 11, "bold"), text_color=PALETTE["indigolight"]); g.pack(side="left", padx=(0, 5))
         p = ctk.CTkProgressBar(c, width=350, progress_color=PALETTE["primary"]); p.set(0); p.pack(side="left", padx=25)
-        l = ctk.CTkLabel(c, text="HANDSHAKING...", font=("JetBrains Mono", 11)); l.pack(side="left")
-        self.task_registry[tid] = {'pb': p, 'tx': l}
-        threading.Thread(target=self._dl_engine, args=(tid, u, t, surgical), daemon=True).start()
+        l = ctk.CTkLabel(c, text="STATUS: QUEUED", font=("JetBrains Mono", 11)); l.pack(side="left")
+        x = EasyButton(c, text="✕", width=45, command=lambda: self.sched.cancel(tid)); x.pack(side="right", padx=(0, 20))
+        b = EasyButton(c, text="⏸", width=45, command=lambda: self._toggle_task(tid)); b.pack(side="right", padx=10)
+        self.task_registry[tid] = {'pb': p, 'tx': l, 'bp': b, 'sg': g}
+        return True
 
-    def _dl_engine(self, tid, u, t, surg):
-        ext = self.vars["ext"].get()
-        fid = self.vars["target_id"].get()
-        
-        def h(d):
-            if d['status'] == 'downloading':
-                try:
-                    v = float(d.get('_percent_str', '0%').replace('%','').strip())
-                    self.bus.put({'id': tid, 'type': 'p', 'v': v, 's': d.get('_speed_str','0B/s'), 'e': d.get('_eta_str','00:00')})
-                except: pass
-
-        # Basic Format Selection
-        opts = {
-            'format': f"{fid}+bestaudio/best" if fid else "bestvideo+bestaudio/best",
-            'outtmpl': os.path.join(self.vars["path"].get(), "%(title)s.%(ext)s"),
-            'progress_hooks': [h],
-            'postprocessors': []
-        }
+    # Nothing was queued (already archived under this profile): a dismissable note instead of a task card.
+    def _skip_card(self, t):
+        self._tab("Execution Queue")
+        c = EasyFrame(self.q_scroll, height=60); c.pack(fill="x", pady=6, padx=20); c.pack_propagate(False)
+        ctk.CTkLabel(c, text=t, font=("Inter", 13, "bold"), text_color=PALETTE["text_s"]).pack(side="left", padx=30)
+        ctk.CTkLabel(c, text="STATUS: SKIPPED (ALREADY ARCHIVED)", font=("JetBrains Mono", 11), text_color=PALETTE["text_s"]).pack(side="left", padx=25)
+        EasyButton(c, text="✕", width=45, command=c.destroy).pack(side="right", padx=(0, 20))
 
-        # --- FIX: Handle Audio Extraction (MP3/WAV) ---
-        if ext in ['mp3', 'wav']:
-            opts['format'] = 'bestaudio/best'
-            opts['postprocessors'].append({
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': ext,
-                'preferredquality': '192',
-            })
-        
-        # --- FIX: Handle Video Container (MP4/MKV) ---
-        elif ext in ['mp4', 'mkv']:
-            opts['merge_output_format'] = ext
-            if ext == 'mp4' and self.vars["opt_aac"].get():
-                opts['postprocessors'].append({'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'})
-                opts['postprocessor_args'] = ['-c:a', 'aac', '-b:a', '192k']
-
-        # Temporal Clipping
-        if surg:
-            s_t = self._t_parse(self.vars["t_start"].get())
-            e_t = self._t_parse(self.vars["t_end"].get())
-            opts['download_ranges'] = lambda info, dict: [{'start_time': s_t, 'end_time': e_t}]
-            opts['force_keyframes_at_cuts'] = True
-
-        # SponsorBlock Logic
-        if self.vars["opt_sponsor"].get():
-            opts['postprocessors'].append({'key': 'SponsorBlock'})
-            opts['postprocessors'].append({'key': 'ModifyChapters', 'remove_sponsor_segments': ['sponsor', 'intro', 'outro', 'selfpromo']})
-
-        # Thumbnail & Metadata Logic
-        if self.vars["opt_thumb"].get():
-            opts['postprocessors'].append({'key': 'EmbedThumbnail'})
-            opts['postprocessors'].append({'key': 'FFmpegMetadata'})
-
-        # Subtitles
-        if self.vars["opt_subs"].get():
-            opts['writesubtitles'] = True
-            opts['subtitleslangs'] = ['en.*']
+    def _rehydrate(self):
+        for tid, t, u, prio, cfg, state in self.engine.pending():
+            self._spawn_worker(t, u, prio=prio, cfg=cfg, tid=tid, state=state)
 
-        try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                ydl.download([u])
-            self.bus.put({'id': tid, 'type': 'f'})
-            self.db.log_transaction(t, u, ext, self.vars["target_res"].get(), "SUCCESS", self.vars["path"].get())
-        except Exception as e:
-            print(f"Error executing task: {e}")
-            self.bus.put({'id': tid, 'type': 'e'})
-
-    def _t_parse(self, ts):
-        try:
-            v = list(map(int, ts.split(':')))
-            if len(v) == 3: return v[0]*3600 + v[1]*60 + v[2]
-            return v[0]*60 + v[1]
-        except: return 0
+    def _toggle_task(self, tid):
+        t = self.sched.tasks.get(tid)
+        if not t: return
+        if t['state'] in ('paused', 'failed') or t['flag'] == 'pause': self.sched.resume(tid)
+        else: self.sched.pause(tid)
 
     def op_preview(self):
         if not self.cache_media: return
-        self.kill_preview.clear()
-        threading.Thread(target=self._prev_engine, daemon=True).start()
+        self.kill_preview.set()
+        self.kill_preview = threading.Event()
+        self.preview = EasyPreview(self.kill_preview, self.vars["prev_fps"].get())
+        self.preview.size = (self.mon_canv.winfo_width(), self.mon_canv.winfo_height())
+        self.prev_mark = (time.monotonic(), 0, 0, 0)
+        threading.Thread(target=self._prev_engine, args=(self.preview,), daemon=True).start()
+        self._prev_tick(self.preview)
 
-    def _prev_engine(self):
-        u = self.cache_media['webpage_url']
-        try:
-            with yt_dlp.YoutubeDL({'format': 'best[height<=360]'}) as ydl:
-                raw = ydl.extract_info(u, download=False)['url']
-            cap = cv2.VideoCapture(raw)
-            while not self.kill_preview.is_set():
-                ok, f = cap.read()
-                if not ok: break
-                rgb = cv2.cvtColor(f, cv2.COLOR_BGR2RGB)
-                im = Image.fromarray(rgb).resize((self.mon_canv.winfo_width(), self.mon_canv.winfo_height()))
-                tk_im = ImageTk.PhotoImage(image=im)
-                self.after(0, lambda x=tk_im: self._prev_draw(x))
-                time.sleep(0.03)
-            cap.release()
-        except: pass
+    def _prev_engine(self, pv):
+        try: pv.run(self.engine.preview_url(self.cache_media['webpage_url']))
+        except Exception as e: pv.error = str(e)
 
-    def _prev_draw(self, x):
-        self.mon_canv.create_image(0, 0, anchor="nw", image=x)
-        self.mon_canv.image = x
+    def _prev_tick(self, pv):
+        if pv is not self.preview or pv.stop.is_set(): return
+        self.after(max(5, int(1000 / pv.max_fps / 2)), lambda: self._prev_tick(pv))
+        arr = pv.take()
+        if arr is not None:
+            try:
+                Image, ImageTk = lazy("PIL.Image"), lazy("PIL.ImageTk")
+                im = Image.frombuffer("RGB", (arr.shape[1], arr.shape[0]), arr, "raw", "RGB", 0, 1)
+                if self.mon_photo is None or (self.mon_photo.width(), self.mon_photo.height()) != im.size:
+                    self.mon_photo = ImageTk.PhotoImage(im)
+                    self.mon_canv.itemconfigure(self.mon_img, image=self.mon_photo)
+                else: self.mon_photo.paste(im)
+            finally: pv.release()
+            pv.shown += 1
+            self.mon_canv.coords(self.mon_img, self.mon_canv.winfo_width() // 2, self.mon_canv.winfo_height() // 2)
+        t, d0, x0, s0 = self.prev_mark
+        dt = time.monotonic() - t
+        if dt >= 1:
+            txt = pv.error or f"DECODED {(pv.decoded - d0) / dt:.0f} fps | DROPPED {(pv.dropped - x0) / dt:.0f} fps | DISPLAYED {(pv.shown - s0) / dt:.0f} fps"
+            self.mon_canv.itemconfigure(self.mon_stats, text=txt)
+            self.mon_canv.tag_raise(self.mon_stats)
+            self.prev_mark = (time.monotonic(), pv.decoded, pv.dropped, pv.shown)
 
-    def _render_playlist(self, m):
+    def _render_playlist(self, m, streaming=False):
         self.navigate("Playlist Engine")
-        for w in self.pl_list.winfo_children(): w.destroy()
-        self.cache_playlist = []
-        for ent in m['entries']:
-            v = tk.BooleanVar(value=True)
-            r = ctk.CTkFrame(self.pl_list, fg_color="transparent"); r.pack(fill="x", pady=3)
-            ctk.CTkCheckBox(r, text=ent.get('title', 'ENTRY_NULL'), variable=v, font=("Inter", 12), checkbox_color=PALETTE["primary"]).pack(side="left", padx=25)
-            self.cache_playlist.append((v, ent.get('title'), ent.get('url') or ent.get('webpage_url')))
+        self.btn_run.configure(text="EXECUTE FULL DEPLOY", state="disabled")
+        self.pl_model = self.pl_list.model = EasyPlaylistModel()
+        self.pl_model.set_filter(self.pl_filter.get())
+        self.pl_list.top, self.pl_list.anchor = 0, None
+        self._pl_append(m['entries'], self.scan_gen, done=not streaming)
+
+    def _pl_append(self, batch, gen, done=False):
+        if gen != self.scan_gen: return
+        self.pl_model.extend(batch)
+        self.pl_list.refresh()
+        self._pl_count("" if done else "STREAMING... ")
+
+    def _pl_apply(self, fn):
+        fn()
+        self.pl_list.refresh()
+        self._pl_count()
+
+    def _pl_count(self, prefix=""):
+        self.pl_meta.configure(text=f"{prefix}{len(self.pl_model)} ENTRIES | {self.pl_model.count()} SELECTED")
 
     def op_bulk(self):
         self.navigate("Execution Queue")
-        for v, t, u in self.cache_playlist:
-            if v.get(): self._spawn_worker(t, u)
+        n = sum(not self._spawn_worker(t, u, prio=EasyScheduler.PRIO_BULK, aid=aid, quiet=True) for t, u, aid in self.pl_model.selected())
+        if n: self._skip_card(f"{n} PLAYLIST ENTRIES")
+
+def startup_report(t_init, t_paint):
+    lines = ["STARTUP REPORT"]
+    for name, dt in sorted(IMPORT_TIMES.items(), key=lambda x: -x[1]):
+        lines.append(f"  import {name:<40} {dt * 1000:8.1f} ms")
+    lines.append(f"  {'window constructed':<47} {t_init * 1000:8.1f} ms")
+    lines.append(f"  {'first paint':<47} {t_paint * 1000:8.1f} ms")
+    return "\n".join(lines)
 
 if __name__ == "__main__":
     ctk.set_appearance_mode("dark")
     app = YTDLPEasyGUI()
+    app.t_init = time.perf_counter() - _BOOT
+    if "--startup-report" in sys.argv:
+        app.bind("<<FirstPaint>>", lambda e: (print(startup_report(app.t_init, app.t_paint)), app.destroy()))
     app.mainloop()